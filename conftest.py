@@ -67,6 +67,7 @@ def create_alex_chen() -> AgentProfile:
     
     High technical skills, confident, pragmatic.
     """
+    now = datetime.now(timezone.utc)
     return AgentProfile(
         agent_id=uuid4(),
         name="Alex Chen",
@@ -99,8 +100,8 @@ def create_alex_chen() -> AgentProfile:
         ),
         knowledge_domains=["distributed_systems", "api_design", "database_optimization"],
         knowledge_gaps=["frontend", "mobile", "ml_ops"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -109,6 +110,7 @@ def create_maya_patel() -> AgentProfile:
     
     Design expertise, empathetic, creative.
     """
+    now = datetime.now(timezone.utc)
     return AgentProfile(
         agent_id=uuid4(),
         name="Maya Patel",
@@ -141,8 +143,8 @@ def create_maya_patel() -> AgentProfile:
         ),
         knowledge_domains=["design_systems", "user_psychology", "accessibility"],
         knowledge_gaps=["backend", "devops", "data_engineering"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -151,6 +153,7 @@ def create_emily_rodriguez() -> AgentProfile:
     
     Lower confidence, curious, deferential.
     """
+    now = datetime.now(timezone.utc)
     return AgentProfile(
         agent_id=uuid4(),
         name="Emily Rodriguez",
@@ -183,8 +186,8 @@ def create_emily_rodriguez() -> AgentProfile:
         ),
         knowledge_domains=["react", "javascript_basics"],
         knowledge_gaps=["backend", "databases", "system_design", "devops"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -193,6 +196,7 @@ def create_david_kim() -> AgentProfile:
     
     Experienced, facilitative, high leadership skills.
     """
+    now = datetime.now(timezone.utc)
     return AgentProfile(
         agent_id=uuid4(),
         name="David Kim",
@@ -225,8 +229,8 @@ def create_david_kim() -> AgentProfile:
         ),
         knowledge_domains=["team_leadership", "architecture", "agile"],
         knowledge_gaps=["ml", "frontend_frameworks", "mobile"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -12,7 +12,14 @@ from pydantic import BaseModel, Field
 from src.agents.repository import AgentRepository
 from src.api.dependencies import AgentRepo
 from src.cognitive import InternalMind
-from src.social.context import SocialContext, ParticipantInfo, GroupType
+from src.social.context import (
+    SocialContext,
+    ParticipantInfo,
+    GroupType,
+    DiscussionPhase,
+    EnergyLevel,
+    ConsensusLevel,
+)
 from src.social.intent import ExternalizationIntent, ExternalizationDecision
 from src.social.intelligence import SocialIntelligence
 from src.social.models import Stimulus
@@ -60,10 +67,16 @@ class SocialContextInput(BaseModel):
     my_status_relative: str = Field(default="peer", description="Agent's relative status")
     current_speaker: Optional[str] = Field(None, description="Current speaker ID")
     topic_under_discussion: str = Field(default="", description="Current topic")
-    discussion_phase: str = Field(default="exploring", description="Phase of discussion")
+    discussion_phase: DiscussionPhase = Field(
+        default=DiscussionPhase.EXPLORING, description="Phase of discussion"
+    )
     speaking_distribution: Dict[str, int] = Field(default_factory=dict)
-    energy_level: str = Field(default="engaged", description="Conversation energy")
-    consensus_level: str = Field(default="discussing", description="Level of agreement")
+    energy_level: EnergyLevel = Field(
+        default=EnergyLevel.ENGAGED, description="Conversation energy"
+    )
+    consensus_level: ConsensusLevel = Field(
+        default=ConsensusLevel.DISCUSSING, description="Level of agreement"
+    )
 
 
 class EvaluateRequest(BaseModel):
@@ -93,10 +106,10 @@ class MeetingStateInput(BaseModel):
     participants: List[Dict[str, Any]] = Field(default_factory=list)
     current_speaker: Optional[str] = Field(None)
     current_topic: str = Field(default="")
-    phase: str = Field(default="exploring")
+    phase: DiscussionPhase = Field(default=DiscussionPhase.EXPLORING)
     speaking_distribution: Dict[str, int] = Field(default_factory=dict)
-    energy: str = Field(default="engaged")
-    consensus: str = Field(default="discussing")
+    energy: EnergyLevel = Field(default=EnergyLevel.ENGAGED)
+    consensus: ConsensusLevel = Field(default=ConsensusLevel.DISCUSSING)
     expertise_gaps: List[str] = Field(default_factory=list)
 
 
@@ -229,7 +242,7 @@ async def evaluate_should_speak(
         is_mandatory=decision.is_mandatory,
         contribution_type=decision.contribution_type,
         timing=decision.timing,
-        factors=decision.factors,
+        factors=dict(decision.factors),
     )
 
 
@@ -278,10 +291,10 @@ async def build_context_from_meeting(
         my_status_relative=context.my_status_relative,
         current_speaker=context.current_speaker,
         topic_under_discussion=context.topic_under_discussion,
-        discussion_phase=context.discussion_phase,
+        discussion_phase=context.discussion_phase.value,
         participant_count=len(context.participants),
-        energy_level=context.energy_level,
-        consensus_level=context.consensus_level,
+        energy_level=context.energy_level.value,
+        consensus_level=context.consensus_level.value,
     )
 
 
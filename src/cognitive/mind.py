@@ -473,7 +473,7 @@ class InternalMind:
             True if thought relates to topic
         """
         topic_lower = topic.lower()
-        content_lower = thought.content.lower()
+        content_lower = thought.content_lower
         
         # Check for direct topic mention
         if topic_lower in content_lower:
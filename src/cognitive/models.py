@@ -84,6 +84,16 @@ class Thought(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @property
+    def word_count(self) -> int:
+        """Number of whitespace-separated words in the content."""
+        return len(self.content.split())
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, for case-insensitive keyword checks."""
+        return self.content.lower()
+
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
         return {
@@ -158,6 +168,18 @@ class CognitiveResult(BaseModel):
             return 0.0
         return sum(t.confidence for t in self.thoughts) / len(self.thoughts)
 
+    @property
+    def tiers_mask(self) -> int:
+        """Get the tiers used as a bitmask, bit ``tier.value`` per tier.
+
+        Lets callers test several tiers against one int instead of
+        scanning tiers_used for each.
+        """
+        mask = 0
+        for tier in self.tiers_used:
+            mask |= 1 << tier.value
+        return mask
+
     @property
     def highest_tier_used(self) -> Optional[CognitiveTier]:
         """Get the highest cognitive tier that was used."""
@@ -81,6 +81,16 @@ class CognitiveProcessor:
         start_time = datetime.now(timezone.utc)
         stimulus_id = uuid4()
 
+        # Nothing to think about: skip planning and model calls entirely
+        if not stimulus.strip():
+            elapsed_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            return CognitiveResult(
+                primary_thought=None,
+                processing_time_ms=elapsed_ms,
+                agent_id=self.agent.agent_id,
+                stimulus_id=stimulus_id,
+            )
+
         # Plan cognitive strategy
         strategy = self._plan_strategy(urgency, complexity, relevance)
         logger.debug(
@@ -3,7 +3,7 @@
 import asyncio
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.infrastructure.model_client import (
     InferenceRequest,
@@ -29,6 +29,9 @@ class MockConfig:
     # Tokens per word estimate (for usage simulation)
     tokens_per_word: float = 1.3
 
+    # Reuse the response for a repeated prompt, skipping simulated latency
+    cache_responses: bool = False
+
 
 @dataclass
 class MockModelClient:
@@ -39,6 +42,7 @@ class MockModelClient:
     - Deterministic or random responses
     - Controllable error injection
     - Usage tracking
+    - Optional response reuse for repeated prompts
     """
 
     config: ModelConfig
@@ -48,6 +52,9 @@ class MockModelClient:
     _call_history: List[InferenceRequest] = field(default_factory=list)
     _total_tokens: int = 0
 
+    # Responses by (prompt, max_tokens), filled when cache_responses is set
+    _response_cache: Dict[Tuple[str, int], str] = field(default_factory=dict)
+
     # Response templates by tier
     RESPONSE_TEMPLATES = {
         ModelTier.SMALL: [
@@ -93,8 +100,14 @@ class MockModelClient:
         # Record call
         self._call_history.append(request)
 
+        # A repeated prompt returns its earlier response without the wait
+        cache_key = (request.prompt, request.max_tokens)
+        response_text = (
+            self._response_cache.get(cache_key) if self.mock_config.cache_responses else None
+        )
+
         # Simulate latency based on tier
-        latency_ms = self._simulate_latency()
+        latency_ms = 0.0 if response_text is not None else self._simulate_latency()
         await asyncio.sleep(latency_ms / 1000)
 
         # Check for simulated failure
@@ -103,7 +116,10 @@ class MockModelClient:
                 raise RuntimeError(f"Simulated failure for {self.config.tier.value}")
 
         # Generate response
-        response_text = self._generate_response(request)
+        if response_text is None:
+            response_text = self._generate_response(request)
+            if self.mock_config.cache_responses:
+                self._response_cache[cache_key] = response_text
 
         # Calculate tokens (approximate)
         prompt_tokens = self._estimate_tokens(request.prompt)
@@ -189,6 +205,10 @@ class MockModelClient:
         self._call_history.clear()
         self._total_tokens = 0
 
+    def clear_response_cache(self) -> None:
+        """Forget responses kept for repeated prompts."""
+        self._response_cache.clear()
+
     def set_healthy(self, healthy: bool) -> None:
         """Set health status for testing."""
         self.mock_config.is_healthy = healthy
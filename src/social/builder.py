@@ -87,12 +87,12 @@ class SocialContextBuilder:
             my_status_relative=my_status,
             current_speaker=meeting_state.get("current_speaker"),
             topic_under_discussion=meeting_state.get("current_topic", ""),
-            discussion_phase=meeting_state.get("phase", DiscussionPhase.EXPLORING.value),
+            discussion_phase=meeting_state.get("phase", DiscussionPhase.EXPLORING),
             expertise_present=expertise_present,
             expertise_gaps=meeting_state.get("expertise_gaps", []),
             speaking_distribution=speaking_distribution,
-            energy_level=meeting_state.get("energy", EnergyLevel.ENGAGED.value),
-            consensus_level=meeting_state.get("consensus", ConsensusLevel.DISCUSSING.value),
+            energy_level=meeting_state.get("energy", EnergyLevel.ENGAGED),
+            consensus_level=meeting_state.get("consensus", ConsensusLevel.DISCUSSING),
         )
     
     @staticmethod
@@ -170,11 +170,11 @@ class SocialContextBuilder:
             my_status_relative=my_status,
             current_speaker=current_speaker,
             topic_under_discussion=topic,
-            discussion_phase=DiscussionPhase.EXPLORING.value,
+            discussion_phase=DiscussionPhase.EXPLORING,
             expertise_present=expertise_present,
             speaking_distribution=speaking_distribution,
-            energy_level=EnergyLevel.ENGAGED.value,
-            consensus_level=ConsensusLevel.DISCUSSING.value,
+            energy_level=EnergyLevel.ENGAGED,
+            consensus_level=ConsensusLevel.DISCUSSING,
         )
     
     @staticmethod
@@ -194,7 +194,7 @@ class SocialContextBuilder:
             my_status_relative="peer",
             current_speaker=None,
             topic_under_discussion="",
-            discussion_phase=DiscussionPhase.EXPLORING.value,
+            discussion_phase=DiscussionPhase.EXPLORING,
         )
     
     @staticmethod
@@ -225,7 +225,7 @@ class SocialContextBuilder:
             my_status_relative="peer",
             current_speaker=None,
             topic_under_discussion=topic,
-            discussion_phase=DiscussionPhase.EXPLORING.value,
+            discussion_phase=DiscussionPhase.EXPLORING,
             expertise_present=expertise_present,
         )
     
@@ -235,7 +235,7 @@ class SocialContextBuilder:
         participants: List[ParticipantInfo],
         my_role: str = "participant",
         topic: str = "",
-        phase: str = DiscussionPhase.EXPLORING.value,
+        phase: DiscussionPhase = DiscussionPhase.EXPLORING,
     ) -> SocialContext:
         """Create a meeting context with multiple participants.
         
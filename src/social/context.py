@@ -7,9 +7,14 @@ about when and how to participate in conversations.
 Phase 5 of the Cognitive Agent Engine.
 """
 
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Expertise maps larger than this are searched through an _ExpertiseIndex
+_EXPERTISE_INDEX_MIN_SIZE = 16
 
 
 class GroupType(Enum):
@@ -56,6 +61,77 @@ class ConsensusLevel(Enum):
     CONFLICTED = "conflicted"  # Significant conflict
 
 
+class _ExpertiseIndex:
+    """Substring index over the names in an expertise map.
+    
+    Answers "which expertise name, in map order, is the first one that
+    contains a skill or is contained in it" without lowercasing and
+    scanning every name per query:
+    
+    - Names containing the skill are found with one search over all
+      lowercased names joined by newlines.
+    - Names contained in the skill are found by walking a character
+      trie of the lowercased names from each position of the skill.
+    """
+    
+    def __init__(self, keys: Tuple[str, ...]):
+        """Build the index.
+        
+        Args:
+            keys: Expertise names in map order
+        """
+        self.keys = keys
+        lowered = [key.lower() for key in keys]
+        
+        self._haystack = "\n".join(lowered)
+        self._starts: List[int] = []
+        offset = 0
+        for name in lowered:
+            self._starts.append(offset)
+            offset += len(name) + 1
+        
+        # Nested dicts keyed by character; the None key marks the end of a
+        # name and holds the lowest map position of that name
+        self._trie: dict = {}
+        for position, name in enumerate(lowered):
+            node = self._trie
+            for char in name:
+                node = node.setdefault(char, {})
+            node.setdefault(None, position)
+    
+    def first_match(self, skill_lower: str) -> Optional[int]:
+        """Find the map position of the first name matching a skill.
+        
+        Args:
+            skill_lower: Lowercased skill without newlines
+            
+        Returns:
+            Position in keys of the first matching name, or None
+        """
+        best = None
+        
+        # Names that contain the skill
+        found = self._haystack.find(skill_lower)
+        if found != -1:
+            best = bisect_right(self._starts, found) - 1
+        
+        # Names contained in the skill
+        root_end = self._trie.get(None)
+        if root_end is not None and (best is None or root_end < best):
+            best = root_end
+        for start in range(len(skill_lower)):
+            node = self._trie
+            for char in skill_lower[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                position = node.get(None)
+                if position is not None and (best is None or position < best):
+                    best = position
+        
+        return best
+
+
 @dataclass
 class ParticipantInfo:
     """Information about another participant in the conversation.
@@ -119,6 +195,12 @@ class SocialContext:
         speaking_distribution: Map of agent_id to contribution count
         energy_level: Current energy of the conversation
         consensus_level: Level of agreement in the group
+    
+    The phase, energy and consensus fields hold enum members so the
+    decision path can compare them by identity. Plain string values
+    (e.g. from API payloads or meeting state dicts) are coerced to the
+    matching member on construction. Role, status and speaker strings
+    are interned so equality checks against literals short-circuit.
     """
     
     # Group composition
@@ -132,7 +214,7 @@ class SocialContext:
     # Current dynamics
     current_speaker: Optional[str] = None
     topic_under_discussion: str = ""
-    discussion_phase: str = DiscussionPhase.EXPLORING.value
+    discussion_phase: DiscussionPhase = DiscussionPhase.EXPLORING
     
     # Expertise map
     expertise_present: Dict[str, List[str]] = field(default_factory=dict)  # skill → agent_ids
@@ -140,8 +222,40 @@ class SocialContext:
     
     # Conversational state
     speaking_distribution: Dict[str, int] = field(default_factory=dict)  # agent_id → count
-    energy_level: str = EnergyLevel.ENGAGED.value
-    consensus_level: str = ConsensusLevel.DISCUSSING.value
+    energy_level: EnergyLevel = EnergyLevel.ENGAGED
+    consensus_level: ConsensusLevel = ConsensusLevel.DISCUSSING
+    
+    # Running sum of speaking_distribution, maintained by update_speaker
+    _total_contributions: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Bumped by add_participant so the participant index knows when to rebuild
+    _participants_version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Lazily built index for large expertise_present maps, rebuilt when the
+    # map's names change
+    _expertise_index: Optional[_ExpertiseIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Participant position by agent_id; built lazily
+    _participant_positions: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _participant_index_version: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+    _indexed_participant_count: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Normalize state fields and seed the contribution total."""
+        self.my_role = sys.intern(self.my_role)
+        self.my_status_relative = sys.intern(self.my_status_relative)
+        if self.current_speaker is not None:
+            self.current_speaker = sys.intern(self.current_speaker)
+        self.discussion_phase = DiscussionPhase(self.discussion_phase)
+        self.energy_level = EnergyLevel(self.energy_level)
+        self.consensus_level = ConsensusLevel(self.consensus_level)
+        self.recompute_totals()
     
     @property
     def group_type(self) -> GroupType:
@@ -172,21 +286,91 @@ class SocialContext:
         Returns:
             ParticipantInfo if found, None otherwise
         """
+        self._ensure_participant_index()
+        position = self._participant_positions.get(agent_id)
+        if position is not None and position < len(self.participants):
+            participant = self.participants[position]
+            if participant.agent_id == agent_id:
+                return participant
+        
+        # Participants list was changed without a refresh; fall back to a scan
         for participant in self.participants:
             if participant.agent_id == agent_id:
                 return participant
         return None
     
+    def add_participant(self, participant: ParticipantInfo) -> None:
+        """Add a participant and register their expertise.
+        
+        Keeps participant and expertise indexes in sync; group_size is
+        left to the caller.
+        
+        Args:
+            participant: The participant to add
+        """
+        self.participants.append(participant)
+        self._participants_version += 1
+        
+        for skill in participant.expertise_areas:
+            self.expertise_present.setdefault(skill.lower(), []).append(
+                participant.agent_id
+            )
+    
+    def set_expertise(self, skill: str, agent_ids: List[str]) -> None:
+        """Set which agents hold a skill in the expertise map.
+        
+        Args:
+            skill: The skill name
+            agent_ids: IDs of agents with that skill
+        """
+        self.expertise_present[skill.lower()] = list(agent_ids)
+    
+    def _ensure_participant_index(self) -> None:
+        """Rebuild the participant index if participants changed since it was built."""
+        if (
+            self._participant_index_version != self._participants_version
+            or self._indexed_participant_count != len(self.participants)
+        ):
+            self.refresh_participant_index()
+    
+    def refresh_participant_index(self) -> None:
+        """Rebuild the participant position map.
+        
+        Rebuilt automatically after add_participant or a change in the
+        number of participants. Only needs calling by hand after replacing
+        participants in place.
+        """
+        positions: Dict[str, int] = {}
+        for position, participant in enumerate(self.participants):
+            positions.setdefault(participant.agent_id, position)
+        self._participant_positions = positions
+        self._participant_index_version = self._participants_version
+        self._indexed_participant_count = len(self.participants)
+    
+    def unspoken_participants(self) -> Iterator[ParticipantInfo]:
+        """Iterate over participants who have not spoken yet.
+        
+        Reads each participant's has_spoken flag as it goes, so flags reset
+        directly (for a new round, say) are honoured.
+        
+        Yields:
+            ParticipantInfo for each participant yet to speak
+        """
+        for participant in self.participants:
+            if not participant.has_spoken:
+                yield participant
+    
     def update_speaker(self, agent_id: str) -> None:
         """Update current speaker and speaking distribution.
         
         Args:
             agent_id: ID of the agent who is now speaking
         """
-        self.current_speaker = agent_id
+        self.current_speaker = sys.intern(agent_id)
         self.speaking_distribution[agent_id] = (
             self.speaking_distribution.get(agent_id, 0) + 1
         )
+        self._total_contributions += 1
         
         # Update participant's speaking state
         participant = self.get_participant(agent_id)
@@ -200,7 +384,15 @@ class SocialContext:
         Returns:
             Sum of all contributions
         """
-        return sum(self.speaking_distribution.values())
+        return self._total_contributions
+    
+    def recompute_totals(self) -> None:
+        """Resync the running contribution total with speaking_distribution.
+        
+        Only needed after mutating speaking_distribution directly rather
+        than through update_speaker.
+        """
+        self._total_contributions = sum(self.speaking_distribution.values())
     
     def get_contribution_share(self, agent_id: str) -> float:
         """Calculate an agent's share of contributions.
@@ -236,11 +428,61 @@ class SocialContext:
             List of agent IDs with that expertise
         """
         skill_lower = skill.lower()
+        
+        if len(self.expertise_present) > _EXPERTISE_INDEX_MIN_SIZE and "\n" not in skill_lower:
+            index = self._get_expertise_index()
+            position = index.first_match(skill_lower)
+            if position is None:
+                return []
+            return self.expertise_present[index.keys[position]]
+        
         for expertise, agent_ids in self.expertise_present.items():
             if skill_lower in expertise.lower() or expertise.lower() in skill_lower:
                 return agent_ids
         return []
     
+    def _get_expertise_index(self) -> _ExpertiseIndex:
+        """Get the expertise index, rebuilding it if the expertise names changed.
+        
+        The index is checked against the map's current names rather than a
+        version counter, so keys added or removed directly on
+        expertise_present are picked up as well.
+        
+        Returns:
+            _ExpertiseIndex over the current expertise_present names
+        """
+        keys = tuple(self.expertise_present)
+        index = self._expertise_index
+        if index is None or index.keys != keys:
+            index = _ExpertiseIndex(keys)
+            self._expertise_index = index
+        return index
+    
+    def dominant_expert_for(self, topic: str) -> Optional[str]:
+        """Get the sole participant with expertise on a topic, if there is one.
+        
+        Uses the same matching rule as get_participants_with_expertise
+        against the expertise_present map.
+        
+        Args:
+            topic: The topic to check expertise for
+            
+        Returns:
+            The agent ID when exactly one agent's expertise matches any
+            topic keyword, None otherwise
+        """
+        experts: set = set()
+        for keyword in topic.lower().split():
+            for expertise, agent_ids in self.expertise_present.items():
+                expertise_lower = expertise.lower()
+                if keyword in expertise_lower or expertise_lower in keyword:
+                    experts.update(agent_ids)
+                    if len(experts) > 1:
+                        return None
+        if len(experts) == 1:
+            return next(iter(experts))
+        return None
+    
     def has_expert_for(self, topic: str) -> bool:
         """Check if there's an expert present for a topic.
         
@@ -266,11 +508,11 @@ class SocialContext:
             "my_status_relative": self.my_status_relative,
             "current_speaker": self.current_speaker,
             "topic_under_discussion": self.topic_under_discussion,
-            "discussion_phase": self.discussion_phase,
+            "discussion_phase": self.discussion_phase.value,
             "expertise_present": self.expertise_present,
             "expertise_gaps": self.expertise_gaps,
             "speaking_distribution": self.speaking_distribution,
-            "energy_level": self.energy_level,
-            "consensus_level": self.consensus_level,
+            "energy_level": self.energy_level.value,
+            "consensus_level": self.consensus_level.value,
         }
 
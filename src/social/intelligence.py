@@ -8,7 +8,8 @@ Phase 5 of the Cognitive Agent Engine.
 """
 
 import logging
-from typing import List, Optional, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from src.agents.models import AgentProfile
 from src.cognitive.mind import InternalMind
@@ -29,6 +30,57 @@ from src.social.models import Stimulus
 
 logger = logging.getLogger(__name__)
 
+# Minimum expertise relevance to justify speaking, by group size
+_CONTRIBUTION_THRESHOLDS = {
+    GroupType.SOLO: 0.0,       # Always contribute
+    GroupType.PAIR: 0.3,       # Low threshold
+    GroupType.SMALL_TEAM: 0.4,
+    GroupType.MEETING: 0.5,
+    GroupType.LARGE_GROUP: 0.7,
+    GroupType.ARMY: 0.9,       # Only if critical
+}
+
+# How much more than a fair share of the conversation each role may take
+_ROLE_SHARE_MULTIPLIERS = {
+    "facilitator": 2.0,
+    "leader": 1.5,
+    "expert": 1.3,
+    "participant": 1.0,
+    "junior": 0.8,
+    "observer": 0.3,
+}
+
+# Behavior each role suggests
+_ROLE_BEHAVIORS = {
+    "facilitator": "enable_others",
+    "expert": "contribute_in_domain",
+    "participant": "contribute_when_relevant",
+    "observer": "mostly_listen",
+    "leader": "guide_and_decide",
+    "junior": "learn_and_ask",
+}
+
+# (intent, confidence, reason, contribution_type, timing, factors) for a decision
+_Outcome = Tuple[ExternalizationIntent, float, str, Optional[str], str, Dict[str, Any]]
+
+
+class _TopicFacts:
+    """Stimulus-derived values that every agent evaluating it can share.
+    
+    Built once per stimulus so batch evaluation tokenizes the topic and
+    resolves the dominant expert a single time for all agents.
+    """
+    
+    def __init__(self, topic: str, context: SocialContext):
+        self.topic = topic
+        self.keywords = topic.lower().split() if topic else []
+        self._context = context
+    
+    @cached_property
+    def dominant_expert(self) -> Optional[str]:
+        """Sole expert on the topic per the context's expertise map."""
+        return self._context.dominant_expert_for(self.topic)
+
 
 class SocialIntelligence:
     """Evaluates social context to decide if/when to speak.
@@ -57,6 +109,14 @@ class SocialIntelligence:
         """
         self.agent = agent
         self.mind = mind
+        self._my_id = str(agent.agent_id)
+        
+        # Lowercased skill names, joined into one haystack so a keyword
+        # can be checked against every skill with a single substring search
+        self._agent_skill_names = tuple(
+            skill.lower() for skill in agent.skills.get_all_skills()
+        )
+        self._agent_skill_haystack = "\n".join(self._agent_skill_names)
     
     def should_i_speak(
         self,
@@ -75,115 +135,241 @@ class SocialIntelligence:
         Returns:
             ExternalizationDecision with intent, confidence, and reasoning
         """
-        factors = {}
+        return self._decide(stimulus, context, _TopicFacts(stimulus.topic, context))
+    
+    @classmethod
+    def evaluate_batch(
+        cls,
+        stimulus: Stimulus,
+        context: SocialContext,
+        intelligences: Sequence["SocialIntelligence"],
+    ) -> List[ExternalizationDecision]:
+        """Evaluate one stimulus for many agents sharing a social context.
+        
+        Equivalent to calling should_i_speak on each agent, but topic
+        tokenization and the dominant-expert lookup run once for the
+        whole batch rather than once per agent.
+        
+        Args:
+            stimulus: The incoming stimulus to respond to
+            context: The social context shared by all agents
+            intelligences: SocialIntelligence instances to evaluate
+            
+        Returns:
+            One ExternalizationDecision per intelligence, in order
+        """
+        facts = _TopicFacts(stimulus.topic, context)
+        return [
+            intelligence._decide(stimulus, context, facts)
+            for intelligence in intelligences
+        ]
+    
+    def _decide(
+        self,
+        stimulus: Stimulus,
+        context: SocialContext,
+        facts: _TopicFacts,
+    ) -> ExternalizationDecision:
+        """Run the decision steps using precomputed topic facts.
+        
+        Args:
+            stimulus: The incoming stimulus to respond to
+            context: The current social context
+            facts: Values derived from the stimulus topic
+            
+        Returns:
+            ExternalizationDecision with intent, confidence, and reasoning
+        """
+        intent, confidence, reason, contribution_type, timing, factors = (
+            self._choose_outcome(stimulus, context, facts)
+        )
+        return ExternalizationDecision(
+            intent=intent,
+            confidence=confidence,
+            reason=reason,
+            contribution_type=contribution_type,
+            timing=timing,
+            factors=factors,
+        )
+    
+    def _choose_outcome(
+        self,
+        stimulus: Stimulus,
+        context: SocialContext,
+        facts: _TopicFacts,
+    ) -> _Outcome:
+        """Walk the decision steps and pick the outcome.
+        
+        Each step returns a plain outcome tuple so the decision object is
+        constructed in exactly one place, by _decide. Intermediate results
+        are kept in locals and the factors dict is only assembled on the
+        branch actually taken.
+        
+        Args:
+            stimulus: The incoming stimulus to respond to
+            context: The current social context
+            facts: Values derived from the stimulus topic
+            
+        Returns:
+            Tuple of (intent, confidence, reason, contribution_type, timing, factors)
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         # 1. Am I directly addressed?
         if self._am_i_directly_addressed(stimulus):
-            logger.debug(f"Agent {self.agent.name} directly addressed, must respond")
-            return ExternalizationDecision.must_respond(
-                reason="directly_addressed",
-                contribution_type=ContributionType.RESPONSE.value,
-                factors={"directly_addressed": True},
+            if debug:
+                logger.debug(f"Agent {self.agent.name} directly addressed, must respond")
+            return (
+                ExternalizationIntent.MUST_RESPOND,
+                1.0,
+                "directly_addressed",
+                ContributionType.RESPONSE.value,
+                ContributionTiming.NOW.value,
+                {"directly_addressed": True},
             )
         
         # 2. Calculate expertise relevance
-        relevance = self._calculate_expertise_match(stimulus.topic)
-        factors["expertise_relevance"] = relevance
+        relevance = self._keyword_expertise_match(stimulus.topic, facts.keywords)
         
         if relevance < 0.3:
-            logger.debug(
-                f"Agent {self.agent.name} has low relevance ({relevance:.2f}) "
-                f"for topic '{stimulus.topic}'"
-            )
-            return ExternalizationDecision.passive_awareness(
-                confidence=0.9,
-                reason="not_my_area",
-                factors=factors,
+            if debug:
+                logger.debug(
+                    f"Agent {self.agent.name} has low relevance ({relevance:.2f}) "
+                    f"for topic '{stimulus.topic}'"
+                )
+            return (
+                ExternalizationIntent.PASSIVE_AWARENESS,
+                0.9,
+                "not_my_area",
+                None,
+                ContributionTiming.WHEN_ASKED.value,
+                {"expertise_relevance": relevance},
             )
         
-        # 3. Check if I should defer to an expert
-        should_defer, defer_to = self._should_defer_to_expert(stimulus.topic, context)
-        factors["should_defer"] = should_defer
-        factors["defer_to"] = defer_to
+        # 3. Check if I should defer to an expert (moot if I'm the only one)
+        if facts.dominant_expert == self._my_id:
+            should_defer, defer_to = False, None
+        else:
+            should_defer, defer_to = self._should_defer_to_expert(
+                stimulus.topic, context, my_expertise=relevance, keywords=facts.keywords
+            )
         
         if should_defer:
-            logger.debug(
-                f"Agent {self.agent.name} deferring to {defer_to} "
-                f"on topic '{stimulus.topic}'"
-            )
-            return ExternalizationDecision.active_listen(
-                confidence=0.7,
-                reason=f"defer_to_expert:{defer_to}",
-                timing=ContributionTiming.WHEN_ASKED.value,
-                factors=factors,
+            if debug:
+                logger.debug(
+                    f"Agent {self.agent.name} deferring to {defer_to} "
+                    f"on topic '{stimulus.topic}'"
+                )
+            return (
+                ExternalizationIntent.ACTIVE_LISTEN,
+                0.7,
+                f"defer_to_expert:{defer_to}",
+                None,
+                ContributionTiming.WHEN_ASKED.value,
+                {
+                    "expertise_relevance": relevance,
+                    "should_defer": should_defer,
+                    "defer_to": defer_to,
+                },
             )
         
         # 4. Check conversational space
-        has_space = self._is_there_conversational_space(context)
-        factors["conversational_space"] = has_space
-        
-        if not has_space:
-            logger.debug(
-                f"Agent {self.agent.name} waiting for conversational space"
-            )
-            return ExternalizationDecision.active_listen(
-                confidence=0.8,
-                reason="no_space",
-                timing=ContributionTiming.WAIT_FOR_OPENING.value,
-                factors=factors,
+        if not self._is_there_conversational_space(context):
+            if debug:
+                logger.debug(
+                    f"Agent {self.agent.name} waiting for conversational space"
+                )
+            return (
+                ExternalizationIntent.ACTIVE_LISTEN,
+                0.8,
+                "no_space",
+                None,
+                ContributionTiming.WAIT_FOR_OPENING.value,
+                {
+                    "expertise_relevance": relevance,
+                    "should_defer": should_defer,
+                    "defer_to": defer_to,
+                    "conversational_space": False,
+                },
             )
         
         # 5. Check if I've said enough
         said_enough = self._have_i_said_enough(context)
-        factors["said_enough"] = said_enough
+        has_critical = None
         
         if said_enough:
             # Unless my input is critical
             has_critical = self._do_i_have_critical_input(stimulus)
-            factors["has_critical_input"] = has_critical
             
             if not has_critical:
-                logger.debug(
-                    f"Agent {self.agent.name} has said enough, listening"
-                )
-                return ExternalizationDecision.active_listen(
-                    confidence=0.6,
-                    reason="said_enough",
-                    timing=ContributionTiming.WHEN_ASKED.value,
-                    factors=factors,
+                if debug:
+                    logger.debug(
+                        f"Agent {self.agent.name} has said enough, listening"
+                    )
+                return (
+                    ExternalizationIntent.ACTIVE_LISTEN,
+                    0.6,
+                    "said_enough",
+                    None,
+                    ContributionTiming.WHEN_ASKED.value,
+                    {
+                        "expertise_relevance": relevance,
+                        "should_defer": should_defer,
+                        "defer_to": defer_to,
+                        "conversational_space": True,
+                        "said_enough": True,
+                        "has_critical_input": False,
+                    },
                 )
         
+        # Factors shared by every remaining branch
+        factors = {
+            "expertise_relevance": relevance,
+            "should_defer": should_defer,
+            "defer_to": defer_to,
+            "conversational_space": True,
+            "said_enough": said_enough,
+        }
+        if has_critical is not None:
+            factors["has_critical_input"] = has_critical
+        
         # 6. Check role appropriateness
         role_suggests = self._what_does_role_suggest(context)
         factors["role_suggests"] = role_suggests
         
         if role_suggests == "mostly_listen":
-            logger.debug(
-                f"Agent {self.agent.name} role suggests listening"
-            )
-            return ExternalizationDecision.active_listen(
-                confidence=0.7,
-                reason="role_is_observer",
-                timing=ContributionTiming.WHEN_ASKED.value,
-                factors=factors,
+            if debug:
+                logger.debug(
+                    f"Agent {self.agent.name} role suggests listening"
+                )
+            return (
+                ExternalizationIntent.ACTIVE_LISTEN,
+                0.7,
+                "role_is_observer",
+                None,
+                ContributionTiming.WHEN_ASKED.value,
+                factors,
             )
         
         # 7. Adjust for group size
-        contribution_threshold = self._get_contribution_threshold(context.group_type)
+        group_type = context.group_type
+        contribution_threshold = self._get_contribution_threshold(group_type)
         factors["contribution_threshold"] = contribution_threshold
-        factors["group_type"] = context.group_type.value
+        factors["group_type"] = group_type.value
         
         if relevance < contribution_threshold:
-            logger.debug(
-                f"Agent {self.agent.name} below threshold "
-                f"({relevance:.2f} < {contribution_threshold:.2f}) for group type"
-            )
-            return ExternalizationDecision.may_contribute(
-                confidence=relevance,
-                reason="below_threshold_for_group_size",
-                timing=ContributionTiming.WHEN_ASKED.value,
-                contribution_type=self._determine_contribution_type(stimulus, context),
-                factors=factors,
+            if debug:
+                logger.debug(
+                    f"Agent {self.agent.name} below threshold "
+                    f"({relevance:.2f} < {contribution_threshold:.2f}) for group type"
+                )
+            return (
+                ExternalizationIntent.MAY_CONTRIBUTE,
+                relevance,
+                "below_threshold_for_group_size",
+                self._determine_contribution_type(stimulus, context),
+                ContributionTiming.WHEN_ASKED.value,
+                factors,
             )
         
         # 8. Passed all checks - should contribute
@@ -196,26 +382,20 @@ class SocialIntelligence:
             else ExternalizationIntent.MAY_CONTRIBUTE
         )
         
-        logger.debug(
-            f"Agent {self.agent.name} deciding to contribute "
-            f"(intent={intent.value}, relevance={relevance:.2f})"
-        )
-        
-        if intent == ExternalizationIntent.SHOULD_CONTRIBUTE:
-            return ExternalizationDecision.should_contribute(
-                confidence=relevance,
-                reason="have_valuable_input",
-                contribution_type=contribution_type,
-                factors=factors,
-            )
-        else:
-            return ExternalizationDecision.may_contribute(
-                confidence=relevance,
-                reason="have_valuable_input",
-                timing=ContributionTiming.NOW.value,
-                contribution_type=contribution_type,
-                factors=factors,
+        if debug:
+            logger.debug(
+                f"Agent {self.agent.name} deciding to contribute "
+                f"(intent={intent.value}, relevance={relevance:.2f})"
             )
+        
+        return (
+            intent,
+            relevance,
+            "have_valuable_input",
+            contribution_type,
+            ContributionTiming.NOW.value,
+            factors,
+        )
     
     # ==========================================
     # SELF-AWARENESS METHODS
@@ -230,7 +410,7 @@ class SocialIntelligence:
         Returns:
             True if directly addressed
         """
-        my_id = str(self.agent.agent_id)
+        my_id = self._my_id
         my_name = self.agent.name
         
         # Check explicit direction
@@ -254,15 +434,49 @@ class SocialIntelligence:
         Args:
             topic: The topic to evaluate
             
+        Returns:
+            Relevance score (0.0 to 1.0)
+        """
+        return self._keyword_expertise_match(topic, topic.lower().split())
+    
+    def _keyword_expertise_match(self, topic: str, keywords: List[str]) -> float:
+        """Calculate topic expertise from already-tokenized keywords.
+        
+        Args:
+            topic: The topic to evaluate
+            keywords: Lowercased keywords of the topic
+            
         Returns:
             Relevance score (0.0 to 1.0)
         """
         if not topic:
             return 0.5  # Unknown topic = medium relevance
         
-        keywords = topic.lower().split()
+        if not self._has_skill_overlap(keywords):
+            return 0.0
         return self.agent.skills.get_relevance_score(keywords)
     
+    def _has_skill_overlap(self, keywords: List[str]) -> bool:
+        """Cheap pre-check for whether any keyword can match one of my skills.
+        
+        Uses the same substring rule as SkillSet.get_relevance_score, so a
+        False result guarantees a relevance score of 0.0.
+        
+        Args:
+            keywords: Lowercased topic keywords
+            
+        Returns:
+            True if at least one keyword overlaps a skill name
+        """
+        for keyword in keywords:
+            kw = keyword.replace("-", "_")
+            if kw in self._agent_skill_haystack:
+                return True
+            for skill in self._agent_skill_names:
+                if skill in kw:
+                    return True
+        return False
+    
     def _have_i_said_enough(self, context: SocialContext) -> bool:
         """Check if I'm dominating the conversation.
         
@@ -272,7 +486,7 @@ class SocialIntelligence:
         Returns:
             True if I've contributed more than my fair share
         """
-        my_id = str(self.agent.agent_id)
+        my_id = self._my_id
         my_contributions = context.speaking_distribution.get(my_id, 0)
         total_contributions = context.get_total_contributions()
         
@@ -283,14 +497,7 @@ class SocialIntelligence:
         fair_share = context.get_fair_share()
         
         # Role adjustment
-        role_multiplier = {
-            "facilitator": 2.0,
-            "leader": 1.5,
-            "expert": 1.3,
-            "participant": 1.0,
-            "junior": 0.8,
-            "observer": 0.3,
-        }.get(context.my_role, 1.0)
+        role_multiplier = _ROLE_SHARE_MULTIPLIERS.get(context.my_role, 1.0)
         
         expected_share = fair_share * role_multiplier
         
@@ -326,23 +533,32 @@ class SocialIntelligence:
         self,
         topic: str,
         context: SocialContext,
+        my_expertise: Optional[float] = None,
+        keywords: Optional[List[str]] = None,
     ) -> Tuple[bool, Optional[str]]:
         """Check if someone more qualified is present and should speak first.
         
         Args:
             topic: The topic under discussion
             context: The current social context
+            my_expertise: My already-computed relevance for the topic, if known
+            keywords: The topic's already-tokenized keywords, if known
             
         Returns:
             Tuple of (should_defer, name_of_expert_to_defer_to)
         """
-        my_expertise = self._calculate_expertise_match(topic)
+        if my_expertise is None:
+            my_expertise = self._calculate_expertise_match(topic)
+        defer_threshold = my_expertise + 0.2
         
         # Extract topic keywords
-        keywords = topic.lower().split() if topic else []
+        if keywords is None:
+            keywords = topic.lower().split() if topic else []
+        my_id = self._my_id
         
-        for participant in context.participants:
-            if participant.agent_id == str(self.agent.agent_id):
+        for participant in context.unspoken_participants():
+            # Only unheard participants are candidates for deference
+            if participant.agent_id == my_id:
                 continue
             
             # Estimate their expertise
@@ -350,10 +566,9 @@ class SocialIntelligence:
                 participant, keywords
             )
             
-            # If they're significantly more qualified and haven't spoken
-            if their_expertise > my_expertise + 0.2:
-                if not participant.has_spoken:
-                    return True, participant.name
+            # If they're significantly more qualified, let them speak first
+            if their_expertise > defer_threshold:
+                return True, participant.name
         
         return False, None
     
@@ -401,15 +616,15 @@ class SocialIntelligence:
         """
         # Someone is currently speaking
         if context.current_speaker:
-            if context.current_speaker != str(self.agent.agent_id):
+            if context.current_speaker != self._my_id:
                 return False
         
         # Closing phase - only critical input
-        if context.discussion_phase == DiscussionPhase.CLOSING.value:
+        if context.discussion_phase is DiscussionPhase.CLOSING:
             return False
         
         # Heated discussion - consider if helping or inflaming
-        if context.energy_level == EnergyLevel.HEATED.value:
+        if context.energy_level is EnergyLevel.HEATED:
             # Only speak if I can calm things
             sm = self.agent.social_markers
             return sm.comfort_with_conflict >= 6
@@ -426,15 +641,7 @@ class SocialIntelligence:
             Suggested behavior: "contribute_actively", "contribute_selectively", 
             "mostly_listen", etc.
         """
-        role_behaviors = {
-            "facilitator": "enable_others",
-            "expert": "contribute_in_domain",
-            "participant": "contribute_when_relevant",
-            "observer": "mostly_listen",
-            "leader": "guide_and_decide",
-            "junior": "learn_and_ask",
-        }
-        return role_behaviors.get(context.my_role, "assess_situation")
+        return _ROLE_BEHAVIORS.get(context.my_role, "assess_situation")
     
     def _get_contribution_threshold(self, group_type: GroupType) -> float:
         """Get threshold for contribution based on group size.
@@ -448,15 +655,7 @@ class SocialIntelligence:
         Returns:
             Minimum relevance threshold (0.0 to 1.0)
         """
-        thresholds = {
-            GroupType.SOLO: 0.0,       # Always contribute
-            GroupType.PAIR: 0.3,       # Low threshold
-            GroupType.SMALL_TEAM: 0.4,
-            GroupType.MEETING: 0.5,
-            GroupType.LARGE_GROUP: 0.7,
-            GroupType.ARMY: 0.9,       # Only if critical
-        }
-        return thresholds.get(group_type, 0.5)
+        return _CONTRIBUTION_THRESHOLDS.get(group_type, 0.5)
     
     def _determine_contribution_type(
         self,
@@ -8,7 +8,8 @@ Phase 5 of the Cognitive Agent Engine.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 
 class ExternalizationIntent(Enum):
@@ -49,7 +50,28 @@ class ContributionTiming(Enum):
     END_OF_DISCUSSION = "end_of_discussion"  # Save for wrap-up
 
 
-@dataclass
+# Enum value strings used on hot paths, resolved once at import
+_TIMING_NOW = ContributionTiming.NOW.value
+_TIMING_WAIT = ContributionTiming.WAIT_FOR_OPENING.value
+_TIMING_WHEN_ASKED = ContributionTiming.WHEN_ASKED.value
+_TYPE_RESPONSE = ContributionType.RESPONSE.value
+_TYPE_STATEMENT = ContributionType.STATEMENT.value
+
+# Serialized intent strings, looked up by member instead of through .value
+_INTENT_STR: Dict[ExternalizationIntent, str] = {
+    intent: intent.value for intent in ExternalizationIntent
+}
+
+# Shared read-only factors for decisions built without any
+_EMPTY_FACTORS: Mapping[str, Any] = MappingProxyType({})
+
+# Intents that mean the agent will speak
+_MUST_RESPOND = ExternalizationIntent.MUST_RESPOND
+_SHOULD_CONTRIBUTE = ExternalizationIntent.SHOULD_CONTRIBUTE
+_MAY_CONTRIBUTE = ExternalizationIntent.MAY_CONTRIBUTE
+
+
+@dataclass(slots=True, repr=False, eq=False)
 class ExternalizationDecision:
     """Full externalization decision with reasoning.
     
@@ -62,7 +84,9 @@ class ExternalizationDecision:
         reason: Human-readable explanation for the decision
         contribution_type: If speaking, what type of contribution
         timing: When to make the contribution
-        factors: Debug info about factors considered
+        factors: Debug info about factors considered. Decisions built
+            without factors share one read-only empty mapping; assign a
+            new dict rather than writing into it.
     """
     
     intent: ExternalizationIntent
@@ -71,10 +95,10 @@ class ExternalizationDecision:
     
     # If speaking
     contribution_type: Optional[str] = None  # statement, question, facilitation
-    timing: str = ContributionTiming.NOW.value
+    timing: str = _TIMING_NOW
     
     # For debugging/learning
-    factors: Dict[str, any] = field(default_factory=dict)
+    factors: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_FACTORS)
     
     @property
     def should_speak(self) -> bool:
@@ -83,11 +107,10 @@ class ExternalizationDecision:
         Returns:
             True if intent indicates speaking (MUST_RESPOND, SHOULD, MAY)
         """
-        return self.intent in (
-            ExternalizationIntent.MUST_RESPOND,
-            ExternalizationIntent.SHOULD_CONTRIBUTE,
-            ExternalizationIntent.MAY_CONTRIBUTE,
-        )
+        # Identity checks rather than set membership: Enum.__hash__ is
+        # implemented in Python, so hashing the intent costs more
+        intent = self.intent
+        return intent is _MUST_RESPOND or intent is _SHOULD_CONTRIBUTE or intent is _MAY_CONTRIBUTE
     
     @property
     def is_mandatory(self) -> bool:
@@ -96,7 +119,7 @@ class ExternalizationDecision:
         Returns:
             True only for MUST_RESPOND intent
         """
-        return self.intent == ExternalizationIntent.MUST_RESPOND
+        return self.intent is _MUST_RESPOND
     
     @property
     def is_optional(self) -> bool:
@@ -105,7 +128,7 @@ class ExternalizationDecision:
         Returns:
             True for MAY_CONTRIBUTE intent
         """
-        return self.intent == ExternalizationIntent.MAY_CONTRIBUTE
+        return self.intent is _MAY_CONTRIBUTE
     
     @property
     def should_wait(self) -> bool:
@@ -114,26 +137,30 @@ class ExternalizationDecision:
         Returns:
             True if timing is not NOW
         """
-        return self.timing != ContributionTiming.NOW.value
+        return self.timing != _TIMING_NOW
     
     def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation.
+        
+        The shared empty factors mapping is swapped for a plain dict so the
+        result stays JSON-serializable.
+        """
         return {
-            "intent": self.intent.value,
+            "intent": _INTENT_STR[self.intent],
             "confidence": self.confidence,
             "reason": self.reason,
             "contribution_type": self.contribution_type,
             "timing": self.timing,
             "should_speak": self.should_speak,
             "is_mandatory": self.is_mandatory,
-            "factors": self.factors,
+            "factors": {} if self.factors is _EMPTY_FACTORS else self.factors,
         }
     
     @classmethod
     def must_respond(
         cls,
         reason: str = "directly_addressed",
-        contribution_type: str = ContributionType.RESPONSE.value,
+        contribution_type: str = _TYPE_RESPONSE,
         factors: Optional[Dict] = None,
     ) -> "ExternalizationDecision":
         """Factory for MUST_RESPOND decisions.
@@ -151,7 +178,7 @@ class ExternalizationDecision:
             confidence=1.0,
             reason=reason,
             contribution_type=contribution_type,
-            timing=ContributionTiming.NOW.value,
+            timing=_TIMING_NOW,
             factors=factors or {"directly_addressed": True},
         )
     
@@ -160,7 +187,7 @@ class ExternalizationDecision:
         cls,
         confidence: float,
         reason: str,
-        contribution_type: str = ContributionType.STATEMENT.value,
+        contribution_type: str = _TYPE_STATEMENT,
         factors: Optional[Dict] = None,
     ) -> "ExternalizationDecision":
         """Factory for SHOULD_CONTRIBUTE decisions.
@@ -179,8 +206,8 @@ class ExternalizationDecision:
             confidence=confidence,
             reason=reason,
             contribution_type=contribution_type,
-            timing=ContributionTiming.NOW.value,
-            factors=factors or {},
+            timing=_TIMING_NOW,
+            factors=factors if factors is not None else _EMPTY_FACTORS,
         )
     
     @classmethod
@@ -188,8 +215,8 @@ class ExternalizationDecision:
         cls,
         confidence: float,
         reason: str,
-        timing: str = ContributionTiming.WAIT_FOR_OPENING.value,
-        contribution_type: str = ContributionType.STATEMENT.value,
+        timing: str = _TIMING_WAIT,
+        contribution_type: str = _TYPE_STATEMENT,
         factors: Optional[Dict] = None,
     ) -> "ExternalizationDecision":
         """Factory for MAY_CONTRIBUTE decisions.
@@ -210,7 +237,7 @@ class ExternalizationDecision:
             reason=reason,
             contribution_type=contribution_type,
             timing=timing,
-            factors=factors or {},
+            factors=factors if factors is not None else _EMPTY_FACTORS,
         )
     
     @classmethod
@@ -218,7 +245,7 @@ class ExternalizationDecision:
         cls,
         confidence: float,
         reason: str,
-        timing: str = ContributionTiming.WHEN_ASKED.value,
+        timing: str = _TIMING_WHEN_ASKED,
         factors: Optional[Dict] = None,
     ) -> "ExternalizationDecision":
         """Factory for ACTIVE_LISTEN decisions.
@@ -238,7 +265,7 @@ class ExternalizationDecision:
             reason=reason,
             contribution_type=None,
             timing=timing,
-            factors=factors or {},
+            factors=factors if factors is not None else _EMPTY_FACTORS,
         )
     
     @classmethod
@@ -263,7 +290,7 @@ class ExternalizationDecision:
             confidence=confidence,
             reason=reason,
             contribution_type=None,
-            timing=ContributionTiming.WHEN_ASKED.value,
-            factors=factors or {},
+            timing=_TIMING_WHEN_ASKED,
+            factors=factors if factors is not None else _EMPTY_FACTORS,
         )
 
@@ -6,12 +6,87 @@ that agents need to evaluate for social response decisions.
 Phase 5 of the Cognitive Agent Engine.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import List, Optional
+import re
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, List, Optional, Sequence
 
+# Common words ignored by Stimulus.extract_keywords
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "must", "shall",
+    "can", "need", "dare", "ought", "used", "to", "of", "in",
+    "for", "on", "with", "at", "by", "from", "as", "into",
+    "through", "during", "before", "after", "above", "below",
+    "between", "under", "again", "further", "then", "once",
+    "here", "there", "when", "where", "why", "how", "all",
+    "each", "few", "more", "most", "other", "some", "such",
+    "no", "nor", "not", "only", "own", "same", "so", "than",
+    "too", "very", "just", "and", "but", "if", "or", "because",
+    "until", "while", "about", "against", "this", "that",
+    "these", "those", "it", "its", "i", "you", "we", "they",
+    "he", "she", "my", "your", "our", "their", "his", "her",
+})
 
-@dataclass
+# Punctuation trimmed from the ends of each keyword
+_KEYWORD_PUNCTUATION = ".,!?;:\"'()[]{}"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _ns_from_datetime(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch.
+    
+    Naive datetimes are taken as local time, as datetime.timestamp() does.
+    
+    Args:
+        value: Datetime to convert
+        
+    Returns:
+        Nanoseconds since the epoch, exact to the microsecond
+    """
+    if value.tzinfo is None:
+        value = value.astimezone(timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND * 1000
+
+
+def _keywords(content: str) -> List[str]:
+    """Split content into lowercase keywords.
+    
+    Words are trimmed of edge punctuation; words of two letters or fewer
+    and common stop words are dropped.
+    
+    Args:
+        content: Text to extract keywords from
+        
+    Returns:
+        Keywords in order of appearance
+    """
+    keywords = []
+    for raw_word in content.lower().split():
+        word = raw_word.strip(_KEYWORD_PUNCTUATION)
+        if len(word) > 2 and word not in _STOP_WORDS:
+            keywords.append(word)
+    return keywords
+
+
+@lru_cache(maxsize=1024)
+def _mention_pattern(name_lower: str) -> re.Pattern:
+    """Compile the pattern matching a whole-word mention of a name.
+    
+    Args:
+        name_lower: Lowercased agent name
+        
+    Returns:
+        Case-insensitive pattern that also matches @mentions
+    """
+    return re.compile(rf"(?<!\w){re.escape(name_lower)}(?!\w)", re.IGNORECASE)
+
+
+@dataclass(slots=True, repr=False, eq=False)
 class Stimulus:
     """Input stimulus for social intelligence evaluation.
     
@@ -38,6 +113,34 @@ class Stimulus:
     priority: float = 0.5
     requires_response: bool = False
     
+    # Hashed views of directed_at (as given, and lowercased) plus the list
+    # they were built from, so lookups rebuild only if it is reassigned
+    _directed_source: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _directed_ids: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _directed_lower: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    
+    # isoformat() of the timestamp it was computed from, reused by to_dict
+    _iso_source: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _iso_timestamp: str = field(default="", init=False, repr=False, compare=False)
+    
+    @property
+    def timestamp_ns(self) -> int:
+        """When this stimulus occurred, in nanoseconds since the epoch.
+        
+        An int sort key, so ordering many stimuli compares plain ints
+        rather than datetimes.
+        
+        Returns:
+            Nanoseconds since the epoch, exact to the microsecond
+        """
+        return _ns_from_datetime(self.timestamp)
+    
     @property
     def is_broadcast(self) -> bool:
         """Check if this stimulus is broadcast to all participants.
@@ -59,6 +162,9 @@ class Stimulus:
     def is_directed_at(self, agent_id: str, agent_name: Optional[str] = None) -> bool:
         """Check if this stimulus is directed at a specific agent.
         
+        The targets are hashed into sets on first use. Reassigning
+        directed_at is picked up; edit a copy rather than the list in place.
+        
         Args:
             agent_id: The agent ID to check
             agent_name: Optional agent name to also check
@@ -69,16 +175,18 @@ class Stimulus:
         if self.directed_at is None:
             return False
         
+        if self._directed_source is not self.directed_at:
+            self._directed_ids = frozenset(self.directed_at)
+            self._directed_lower = frozenset(target.lower() for target in self.directed_at)
+            self._directed_source = self.directed_at
+        
         # Check direct ID match
-        if agent_id in self.directed_at:
+        if agent_id in self._directed_ids:
             return True
         
         # Check name match if provided
-        if agent_name:
-            name_lower = agent_name.lower()
-            for target in self.directed_at:
-                if target.lower() == name_lower:
-                    return True
+        if agent_name and agent_name.lower() in self._directed_lower:
+            return True
         
         return False
     
@@ -92,18 +200,9 @@ class Stimulus:
         Returns:
             True if agent is mentioned in content
         """
-        content_lower = self.content.lower()
-        name_lower = agent_name.lower()
-        
-        # Check for name mention
-        if name_lower in content_lower:
-            return True
-        
-        # Check for @mention pattern
-        if f"@{name_lower}" in content_lower:
-            return True
-        
-        return False
+        # Whole-word match, so "Al" is not found in "Ally"; "@name" is
+        # covered too since "@" is not a word character
+        return _mention_pattern(agent_name.lower()).search(self.content) is not None
     
     def extract_keywords(self) -> List[str]:
         """Extract keywords from the stimulus content.
@@ -113,43 +212,41 @@ class Stimulus:
         Returns:
             List of lowercase keywords
         """
-        # Simple approach: split on whitespace and filter
-        words = self.content.lower().split()
-        # Filter out very short words and common stop words
-        stop_words = {
-            "the", "a", "an", "is", "are", "was", "were", "be", "been",
-            "being", "have", "has", "had", "do", "does", "did", "will",
-            "would", "could", "should", "may", "might", "must", "shall",
-            "can", "need", "dare", "ought", "used", "to", "of", "in",
-            "for", "on", "with", "at", "by", "from", "as", "into",
-            "through", "during", "before", "after", "above", "below",
-            "between", "under", "again", "further", "then", "once",
-            "here", "there", "when", "where", "why", "how", "all",
-            "each", "few", "more", "most", "other", "some", "such",
-            "no", "nor", "not", "only", "own", "same", "so", "than",
-            "too", "very", "just", "and", "but", "if", "or", "because",
-            "until", "while", "about", "against", "this", "that",
-            "these", "those", "it", "its", "i", "you", "we", "they",
-            "he", "she", "my", "your", "our", "their", "his", "her",
-        }
+        return _keywords(self.content)
+    
+    @staticmethod
+    def extract_keywords_batch(stimuli: Iterable["Stimulus"]) -> List[List[str]]:
+        """Extract keywords from many stimuli.
         
-        keywords = [
-            word.strip(".,!?;:\"'()[]{}") 
-            for word in words 
-            if len(word) > 2 and word.lower() not in stop_words
-        ]
+        Gives the same result as calling extract_keywords on each stimulus.
         
-        return keywords
+        Args:
+            stimuli: Stimuli to extract keywords from
+            
+        Returns:
+            One keyword list per stimulus, in order
+        """
+        return [_keywords(stimulus.content) for stimulus in stimuli]
     
     def to_dict(self) -> dict:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation.
+        
+        The timestamp string is formatted once and reused for as long as
+        the timestamp is unchanged; the dict itself is built fresh so
+        callers may modify it.
+        """
+        timestamp = self.timestamp
+        if self._iso_source is not timestamp:
+            self._iso_timestamp = timestamp.isoformat()
+            self._iso_source = timestamp
+        
         return {
             "content": self.content,
             "source_id": self.source_id,
             "source_name": self.source_name,
             "directed_at": self.directed_at,
             "topic": self.topic,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso_timestamp,
             "priority": self.priority,
             "requires_response": self.requires_response,
             "is_broadcast": self.is_broadcast,
@@ -220,4 +317,36 @@ class Stimulus:
             requires_response=True,
             priority=0.8,
         )
-
+    
+    @classmethod
+    def from_batch(cls, records: Iterable[Sequence[Any]]) -> List["Stimulus"]:
+        """Create many stimuli that arrived together.
+        
+        Each record holds the constructor fields in order - content, then
+        optionally source_id, source_name, directed_at, topic, timestamp,
+        priority and requires_response. The clock is read once for the
+        whole batch, so every record without its own timestamp shares the
+        same one.
+        
+        Args:
+            records: Positional field tuples, one per stimulus
+            
+        Returns:
+            New Stimulus instances, in order
+            
+        Raises:
+            TypeError: If a record has more values than there are fields
+        """
+        names = [f.name for f in fields(cls) if f.init]
+        timestamp = datetime.now(timezone.utc)
+        stimuli = []
+        for record in records:
+            if len(record) > len(names):
+                raise TypeError(
+                    f"Stimulus record takes at most {len(names)} values ({len(record)} given)"
+                )
+            kwargs = dict(zip(names, record))
+            if kwargs.get("timestamp") is None:
+                kwargs["timestamp"] = timestamp
+            stimuli.append(cls(**kwargs))
+        return stimuli
@@ -4,10 +4,13 @@ These fixtures support testing agent behavior (not just code correctness).
 """
 
 import asyncio
+import functools
 import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from uuid import uuid4
 
 import pytest
@@ -34,14 +37,19 @@ from src.cognitive import (
 # ==========================================
 
 
-def load_test_stimuli() -> Dict:
-    """Load test stimuli from JSON file."""
+@functools.cache
+def load_test_stimuli() -> Mapping[str, Any]:
+    """Load test stimuli from JSON file.
+    
+    The file is read once per session; the result is a read-only view
+    shared by every caller, so copy a category before modifying it.
+    """
     data_path = Path(__file__).parent.parent / "data" / "sample_stimuli.json"
     if data_path.exists():
         with open(data_path) as f:
-            return json.load(f)
+            return MappingProxyType(json.load(f))
     # Fallback default stimuli
-    return {
+    return MappingProxyType({
         "high_urgency": [
             "ALERT: The production server is down!",
             "Critical security vulnerability detected!",
@@ -54,7 +62,7 @@ def load_test_stimuli() -> Dict:
             "What's for lunch today?",
             "Nice weather we're having.",
         ],
-    }
+    })
 
 
 # ==========================================
@@ -62,6 +70,10 @@ def load_test_stimuli() -> Dict:
 # ==========================================
 
 
+# Fixed creation time for test profiles (keeps them reproducible)
+_PROFILE_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
 def create_alex_chen() -> AgentProfile:
     """Create Alex Chen - Senior Backend Developer.
     
@@ -99,8 +111,8 @@ def create_alex_chen() -> AgentProfile:
         ),
         knowledge_domains=["distributed_systems", "api_design", "database_optimization"],
         knowledge_gaps=["frontend", "mobile", "ml_ops"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_PROFILE_TIMESTAMP,
+        updated_at=_PROFILE_TIMESTAMP,
     )
 
 
@@ -141,8 +153,8 @@ def create_maya_patel() -> AgentProfile:
         ),
         knowledge_domains=["design_systems", "user_psychology", "accessibility"],
         knowledge_gaps=["backend", "devops", "data_engineering"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_PROFILE_TIMESTAMP,
+        updated_at=_PROFILE_TIMESTAMP,
     )
 
 
@@ -183,8 +195,8 @@ def create_emily_rodriguez() -> AgentProfile:
         ),
         knowledge_domains=["react", "javascript_basics"],
         knowledge_gaps=["backend", "databases", "system_design", "devops"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_PROFILE_TIMESTAMP,
+        updated_at=_PROFILE_TIMESTAMP,
     )
 
 
@@ -225,51 +237,72 @@ def create_david_kim() -> AgentProfile:
         ),
         knowledge_domains=["team_leadership", "architecture", "agile"],
         knowledge_gaps=["ml", "frontend_frameworks", "mobile"],
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_PROFILE_TIMESTAMP,
+        updated_at=_PROFILE_TIMESTAMP,
     )
 
 
+_PROFILE_FACTORIES = {
+    "alex_chen": create_alex_chen,
+    "maya_patel": create_maya_patel,
+    "emily_rodriguez": create_emily_rodriguez,
+    "david_kim": create_david_kim,
+}
+
+
+@functools.cache
+def _agent_template(name: str) -> AgentProfile:
+    """Build a test profile once; callers share the returned instance.
+    
+    Use the fresh_profile fixture for a copy that may be modified.
+    """
+    return _PROFILE_FACTORIES[name]()
+
+
 # ==========================================
 # Analysis Helpers
 # ==========================================
 
 
+# Phrases counted by count_hedging_words / count_technical_terms
+_HEDGING_WORDS = (
+    "maybe", "perhaps", "possibly", "might", "could be",
+    "i think", "i believe", "not sure", "uncertain",
+    "probably", "seems like", "appears to",
+)
+_TECHNICAL_TERMS = (
+    "api", "database", "server", "client", "architecture",
+    "microservice", "monolith", "cache", "queue", "endpoint",
+    "authentication", "authorization", "latency", "throughput",
+    "scalability", "distributed", "kubernetes", "docker",
+    "postgresql", "redis", "mongodb", "sql", "nosql",
+)
+
+
 def count_hedging_words(text: str) -> int:
     """Count hedging/uncertainty words in text."""
-    hedging_words = [
-        "maybe", "perhaps", "possibly", "might", "could be",
-        "i think", "i believe", "not sure", "uncertain",
-        "probably", "seems like", "appears to",
-    ]
     text_lower = text.lower()
-    return sum(1 for word in hedging_words if word in text_lower)
+    return sum(1 for word in _HEDGING_WORDS if word in text_lower)
 
 
 def count_technical_terms(text: str) -> int:
     """Count technical terms in text."""
-    technical_terms = [
-        "api", "database", "server", "client", "architecture",
-        "microservice", "monolith", "cache", "queue", "endpoint",
-        "authentication", "authorization", "latency", "throughput",
-        "scalability", "distributed", "kubernetes", "docker",
-        "postgresql", "redis", "mongodb", "sql", "nosql",
-    ]
     text_lower = text.lower()
-    return sum(1 for term in technical_terms if term in text_lower)
+    return sum(1 for term in _TECHNICAL_TERMS if term in text_lower)
 
 
 def analyze_response_style(thought: Thought) -> Dict:
     """Analyze the style characteristics of a response."""
     content = thought.content
-    words = content.split()
+    content_lower = thought.content_lower
+    question_count = content.count('?')
     
     return {
-        "word_count": len(words),
-        "sentence_count": content.count('.') + content.count('!') + content.count('?'),
-        "question_count": content.count('?'),
-        "hedging_count": count_hedging_words(content),
-        "technical_count": count_technical_terms(content),
+        "word_count": thought.word_count,
+        "sentence_count": content.count('.') + content.count('!') + question_count,
+        "question_count": question_count,
+        "hedging_count": sum(1 for word in _HEDGING_WORDS if word in content_lower),
+        "technical_count": sum(1 for term in _TECHNICAL_TERMS if term in content_lower),
         "has_structure": any(marker in content for marker in ['1.', '2.', '-', '•', 'First', 'Second']),
         "confidence": thought.confidence,
         "completeness": thought.completeness,
@@ -300,49 +333,89 @@ def compare_responses(response_a: CognitiveResult, response_b: CognitiveResult)
 # ==========================================
 
 
+def _tier_buckets(urgency: float, complexity: float, relevance: float) -> Tuple[int, int, int]:
+    """Bucket strategy parameters by the thresholds of the strategy matrix.
+    
+    Returns:
+        (urgency, complexity, relevance) buckets: urgency 0 (<0.3), 1, 2 (>0.8);
+        complexity 0 (<0.5), 1 (==0.5), 2 (<=0.7), 3 (>0.7);
+        relevance 0 (<0.3), 1, 2 (>0.5)
+    """
+    urgency_bucket = 2 if urgency > 0.8 else 0 if urgency < 0.3 else 1
+    if complexity > 0.7:
+        complexity_bucket = 3
+    elif complexity > 0.5:
+        complexity_bucket = 2
+    else:
+        complexity_bucket = 0 if complexity < 0.5 else 1
+    relevance_bucket = 2 if relevance > 0.5 else 0 if relevance < 0.3 else 1
+    return urgency_bucket, complexity_bucket, relevance_bucket
+
+
+# CognitiveResult.tiers_mask bits checked by validate_tier_selection
+_REFLEX_BIT = 1 << CognitiveTier.REFLEX.value
+_DELIBERATE_BIT = 1 << CognitiveTier.DELIBERATE.value
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Outcome of validate_tier_selection."""
+    
+    valid: bool
+    issues: List[str]
+    urgency: float
+    complexity: float
+    relevance: float
+    tiers_used: List[str]
+
+
 def validate_tier_selection(
     urgency: float,
     complexity: float,
     relevance: float,
     result: CognitiveResult,
-) -> Dict:
+) -> ValidationResult:
     """Validate that tier selection matches expected strategy."""
-    validation = {
-        "valid": True,
-        "issues": [],
-        "urgency": urgency,
-        "complexity": complexity,
-        "relevance": relevance,
-        "tiers_used": [t.name for t in result.tiers_used],
-    }
+    validation = ValidationResult(
+        valid=True,
+        issues=[],
+        urgency=urgency,
+        complexity=complexity,
+        relevance=relevance,
+        tiers_used=[t.name for t in result.tiers_used],
+    )
+    urgency_bucket, complexity_bucket, relevance_bucket = _tier_buckets(
+        urgency, complexity, relevance
+    )
+    tiers_mask = result.tiers_mask
     
     # High urgency + relevant should use REFLEX first
-    if urgency > 0.8 and relevance > 0.5:
-        if CognitiveTier.REFLEX not in result.tiers_used:
-            validation["valid"] = False
-            validation["issues"].append("High urgency should use REFLEX")
+    if urgency_bucket == 2 and relevance_bucket == 2:
+        if not tiers_mask & _REFLEX_BIT:
+            validation.valid = False
+            validation.issues.append("High urgency should use REFLEX")
         if result.thoughts and result.thoughts[0].tier != CognitiveTier.REFLEX:
-            validation["valid"] = False
-            validation["issues"].append("REFLEX should fire first on high urgency")
+            validation.valid = False
+            validation.issues.append("REFLEX should fire first on high urgency")
     
     # Low urgency + high complexity should skip REFLEX
-    if urgency < 0.3 and complexity > 0.7 and relevance > 0.5:
-        if CognitiveTier.REFLEX in result.tiers_used:
-            validation["issues"].append("Low urgency should skip REFLEX (warning)")
-        if CognitiveTier.DELIBERATE not in result.tiers_used:
-            validation["valid"] = False
-            validation["issues"].append("Complex low-urgency needs DELIBERATE")
+    if urgency_bucket == 0 and complexity_bucket == 3 and relevance_bucket == 2:
+        if tiers_mask & _REFLEX_BIT:
+            validation.issues.append("Low urgency should skip REFLEX (warning)")
+        if not tiers_mask & _DELIBERATE_BIT:
+            validation.valid = False
+            validation.issues.append("Complex low-urgency needs DELIBERATE")
     
     # Low relevance should only use REFLEX
-    if relevance < 0.3:
+    if relevance_bucket == 0:
         if len(result.tiers_used) > 1:
-            validation["issues"].append("Low relevance should minimize tiers (warning)")
+            validation.issues.append("Low relevance should minimize tiers (warning)")
     
     return validation
 
 
-def expected_tier_for_params(urgency: float, complexity: float, relevance: float) -> List[CognitiveTier]:
-    """Return expected tiers based on strategy matrix."""
+def _strategy_tiers(urgency: int, complexity: int, relevance: int) -> Tuple[CognitiveTier, ...]:
+    """Apply the strategy matrix to one combination of buckets."""
     # From requirements:
     # High urgency + High relevance -> REFLEX → Parallel REACTIVE → Background DELIBERATE
     # High urgency + Low relevance -> REFLEX only
@@ -350,29 +423,46 @@ def expected_tier_for_params(urgency: float, complexity: float, relevance: float
     # Low urgency + High relevance + Low complexity -> REACTIVE → DELIBERATE
     # Low urgency + Low relevance -> REFLEX only
     
-    if urgency > 0.8 and relevance > 0.5:
-        tiers = [CognitiveTier.REFLEX, CognitiveTier.REACTIVE]
-        if complexity > 0.5:
-            tiers.append(CognitiveTier.DELIBERATE)
-        return tiers
+    if urgency == 2 and relevance == 2:
+        if complexity >= 2:
+            return (CognitiveTier.REFLEX, CognitiveTier.REACTIVE, CognitiveTier.DELIBERATE)
+        return (CognitiveTier.REFLEX, CognitiveTier.REACTIVE)
     
-    if urgency > 0.8 and relevance <= 0.5:
-        return [CognitiveTier.REFLEX]
+    if urgency == 2:
+        return (CognitiveTier.REFLEX,)
     
-    if urgency < 0.3 and relevance > 0.5:
-        if complexity > 0.7:
-            return [CognitiveTier.DELIBERATE, CognitiveTier.ANALYTICAL]
+    if urgency == 0 and relevance == 2:
+        if complexity == 3:
+            return (CognitiveTier.DELIBERATE, CognitiveTier.ANALYTICAL)
         else:
-            return [CognitiveTier.DELIBERATE]
+            return (CognitiveTier.DELIBERATE,)
     
-    if relevance < 0.3:
-        return [CognitiveTier.REFLEX]
+    if relevance == 0:
+        return (CognitiveTier.REFLEX,)
     
     # Medium everything
-    if complexity < 0.5:
-        return [CognitiveTier.REACTIVE]
+    if complexity == 0:
+        return (CognitiveTier.REACTIVE,)
     else:
-        return [CognitiveTier.DELIBERATE]
+        return (CognitiveTier.DELIBERATE,)
+
+
+# Expected tiers for every bucket combination, built once at import and
+# indexed by the composite key (urgency * 4 + complexity) * 3 + relevance
+_TIER_TABLE: Tuple[Tuple[CognitiveTier, ...], ...] = tuple(
+    _strategy_tiers(u, c, r)
+    for u in range(3)
+    for c in range(4)
+    for r in range(3)
+)
+
+
+def expected_tier_for_params(urgency: float, complexity: float, relevance: float) -> List[CognitiveTier]:
+    """Return expected tiers based on strategy matrix."""
+    urgency_bucket, complexity_bucket, relevance_bucket = _tier_buckets(
+        urgency, complexity, relevance
+    )
+    return list(_TIER_TABLE[(urgency_bucket * 4 + complexity_bucket) * 3 + relevance_bucket])
 
 
 # ==========================================
@@ -380,54 +470,67 @@ def expected_tier_for_params(urgency: float, complexity: float, relevance: float
 # ==========================================
 
 
+# Expected word-count range and minimum confidence for each tier
+_TIER_WORD_RANGES: Dict[CognitiveTier, Tuple[int, int]] = {
+    CognitiveTier.REFLEX: (5, 50),
+    CognitiveTier.REACTIVE: (20, 150),
+    CognitiveTier.DELIBERATE: (50, 400),
+    CognitiveTier.ANALYTICAL: (100, 600),
+    CognitiveTier.COMPREHENSIVE: (150, 800),
+}
+_TIER_MIN_CONFIDENCE: Dict[CognitiveTier, float] = {
+    CognitiveTier.REFLEX: 0.4,
+    CognitiveTier.REACTIVE: 0.5,
+    CognitiveTier.DELIBERATE: 0.65,
+    CognitiveTier.ANALYTICAL: 0.75,
+    CognitiveTier.COMPREHENSIVE: 0.8,
+}
+_REFLEX_THOUGHT_TYPES = ("reaction", "observation")
+
+
+@dataclass(slots=True)
+class QualityScore:
+    """Scores from score_response_quality."""
+    
+    length_appropriate: bool
+    word_count: int
+    expected_range: Tuple[int, int]
+    confidence_calibrated: bool
+    type_appropriate: bool
+    overall: float
+
+
 def score_response_quality(
     thought: Thought,
     agent: AgentProfile,
     urgency: float,
     complexity: float,
     relevance: float,
-) -> Dict:
+) -> QualityScore:
     """Score the quality of a response on multiple dimensions."""
-    scores = {}
-    
     # 1. Length appropriateness for tier
-    word_count = len(thought.content.split())
-    expected_ranges = {
-        CognitiveTier.REFLEX: (5, 50),
-        CognitiveTier.REACTIVE: (20, 150),
-        CognitiveTier.DELIBERATE: (50, 400),
-        CognitiveTier.ANALYTICAL: (100, 600),
-        CognitiveTier.COMPREHENSIVE: (150, 800),
-    }
-    min_len, max_len = expected_ranges[thought.tier]
-    scores["length_appropriate"] = min_len <= word_count <= max_len
-    scores["word_count"] = word_count
-    scores["expected_range"] = (min_len, max_len)
+    word_count = thought.word_count
+    min_len, max_len = _TIER_WORD_RANGES[thought.tier]
+    length_appropriate = min_len <= word_count <= max_len
     
     # 2. Confidence calibration
-    expected_min_confidence = {
-        CognitiveTier.REFLEX: 0.4,
-        CognitiveTier.REACTIVE: 0.5,
-        CognitiveTier.DELIBERATE: 0.65,
-        CognitiveTier.ANALYTICAL: 0.75,
-        CognitiveTier.COMPREHENSIVE: 0.8,
-    }
-    scores["confidence_calibrated"] = thought.confidence >= expected_min_confidence[thought.tier]
+    confidence_calibrated = thought.confidence >= _TIER_MIN_CONFIDENCE[thought.tier]
     
     # 3. Thought type appropriateness
     if thought.tier == CognitiveTier.REFLEX:
-        scores["type_appropriate"] = thought.thought_type.value in ["reaction", "observation"]
+        type_appropriate = thought.thought_type.value in _REFLEX_THOUGHT_TYPES
     else:
-        scores["type_appropriate"] = True  # More types are valid for higher tiers
+        type_appropriate = True  # More types are valid for higher tiers
     
     # 4. Overall score
-    scores["overall"] = sum([
-        scores["length_appropriate"],
-        scores["confidence_calibrated"],
-        scores["type_appropriate"],
-    ]) / 3.0
-    
-    return scores
+    return QualityScore(
+        length_appropriate=length_appropriate,
+        word_count=word_count,
+        expected_range=(min_len, max_len),
+        confidence_calibrated=confidence_calibrated,
+        type_appropriate=type_appropriate,
+        overall=(length_appropriate + confidence_calibrated + type_appropriate) / 3.0,
+    )
 
 
 # ==========================================
@@ -435,49 +538,115 @@ def score_response_quality(
 # ==========================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def alex_chen() -> AgentProfile:
-    """Senior Backend Developer - high technical skills."""
-    return create_alex_chen()
+    """Senior Backend Developer - high technical skills.
+    
+    Built once per session and shared; use fresh_profile for a copy.
+    """
+    return _agent_template("alex_chen")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def maya_patel() -> AgentProfile:
-    """UX Designer - design expertise."""
-    return create_maya_patel()
+    """UX Designer - design expertise.
+    
+    Built once per session and shared; use fresh_profile for a copy.
+    """
+    return _agent_template("maya_patel")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def emily_rodriguez() -> AgentProfile:
-    """Junior Developer - lower confidence."""
-    return create_emily_rodriguez()
+    """Junior Developer - lower confidence.
+    
+    Built once per session and shared; use fresh_profile for a copy.
+    """
+    return _agent_template("emily_rodriguez")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def david_kim() -> AgentProfile:
-    """Tech Lead - facilitative, experienced."""
-    return create_david_kim()
+    """Tech Lead - facilitative, experienced.
+    
+    Built once per session and shared; use fresh_profile for a copy.
+    """
+    return _agent_template("david_kim")
 
 
 @pytest.fixture
+def fresh_profile():
+    """Factory that deep-copies a shared profile under a new agent ID.
+    
+    The copy shares no nested models or collections with the session
+    profile, so a test may edit it freely.
+    """
+    def _fresh(profile: AgentProfile) -> AgentProfile:
+        return profile.model_copy(deep=True, update={"agent_id": uuid4()})
+    return _fresh
+
+
+# Processors shared by the session-scoped fixtures below, reset before each test
+_SHARED_PROCESSORS: List[CognitiveProcessor] = []
+
+
+def _reset_processor(processor: CognitiveProcessor) -> None:
+    """Clear a shared processor's mock-router usage and cached responses."""
+    router = processor.router
+    router.budget_manager.reset()
+    for tier, client in router.clients.items():
+        client.reset_history()
+        client.clear_response_cache()
+        router.set_tier_health(tier, True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_processors():
+    """Start every test with fresh budget and call history on shared processors."""
+    for processor in _SHARED_PROCESSORS:
+        _reset_processor(processor)
+
+
+def _shared_processor(agent: AgentProfile):
+    """Create a processor with mock router and register it for resets.
+    
+    Its mock clients keep responses until the next test starts, so a
+    prompt repeated within a test is answered without the simulated
+    latency, while separate tests still get independent responses.
+    """
+    processor = create_processor_with_mock_router(agent)
+    for client in processor.router.clients.values():
+        client.mock_config.cache_responses = True
+    _SHARED_PROCESSORS.append(processor)
+    yield processor
+    _SHARED_PROCESSORS.remove(processor)
+
+
+@pytest.fixture(scope="session")
 def processor_for_alex(alex_chen) -> CognitiveProcessor:
     """Create processor with mock router for Alex Chen."""
-    return create_processor_with_mock_router(alex_chen)
+    yield from _shared_processor(alex_chen)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processor_for_maya(maya_patel) -> CognitiveProcessor:
     """Create processor with mock router for Maya Patel."""
-    return create_processor_with_mock_router(maya_patel)
+    yield from _shared_processor(maya_patel)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def processor_for_emily(emily_rodriguez) -> CognitiveProcessor:
     """Create processor with mock router for Emily Rodriguez."""
-    return create_processor_with_mock_router(emily_rodriguez)
+    yield from _shared_processor(emily_rodriguez)
 
 
-@pytest.fixture
-def test_stimuli() -> Dict:
+@pytest.fixture(scope="session")
+def processor_for_david(david_kim) -> CognitiveProcessor:
+    """Create processor with mock router for David Kim."""
+    yield from _shared_processor(david_kim)
+
+
+@pytest.fixture(scope="session")
+def test_stimuli() -> Mapping[str, Any]:
     """Load test stimuli."""
     return load_test_stimuli()
@@ -16,9 +16,17 @@ Usage:
     python run_behavioral_tests.py full
     python run_behavioral_tests.py strategy identity
     python run_behavioral_tests.py --coverage
+    python run_behavioral_tests.py --workers 4 full
+    python run_behavioral_tests.py --isolated smoke
+
+Tests run in parallel when pytest-xdist is installed (it is in the dev
+extras: pip install -e ".[dev]"); otherwise they run serially. Each module or
+test class stays on one worker, so the fixtures it shares are built once.
+Run directly with: pytest -n auto --dist loadscope tests/behavioral
 """
 
 import argparse
+import importlib.util
 import subprocess
 import sys
 import time
@@ -74,8 +82,22 @@ TEST_SUITES = {
 }
 
 
-def run_tests(suites: list, coverage: bool = False, verbose: int = 1):
-    """Run specified test suites."""
+def run_tests(
+    suites: list,
+    coverage: bool = False,
+    verbose: int = 1,
+    workers: str = "auto",
+    isolated: bool = False,
+    fresh: bool = False,
+):
+    """Run specified test suites.
+    
+    workers is passed to pytest-xdist's -n ("auto" for one per CPU), with
+    tests distributed by module and class; "0" runs serially, stopping
+    after three failures. Tests that failed last time run first; fresh
+    clears pytest's cache so they do not. pytest runs inside this process
+    unless isolated is set, which starts a fresh interpreter.
+    """
     
     # Build list of test files
     test_files = []
@@ -107,11 +129,26 @@ def run_tests(suites: list, coverage: bool = False, verbose: int = 1):
     if coverage:
         cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=term"])
     
+    # Spread tests over worker processes when pytest-xdist is available
+    parallel = workers != "0" and importlib.util.find_spec("xdist") is not None
+    if workers != "0" and not parallel:
+        print("pytest-xdist not installed; running tests serially")
+    
+    if parallel:
+        # Keep each module/class on one worker so its shared fixtures run once
+        cmd.extend(["-n", workers, "--dist", "loadscope"])
+    else:
+        cmd.append("--maxfail=3")  # Stop early (not meaningful across workers)
+    
+    # Run last run's failures first; --fresh discards that history
+    cmd.append("--ff")
+    if fresh:
+        cmd.append("--cache-clear")
+    
     # Add other useful options
     cmd.extend([
         "--tb=short",  # Short tracebacks
-        "-x",  # Stop on first failure
-        "--durations=10",  # Show 10 slowest tests
+        "--durations=25",  # Show 25 slowest tests
     ])
     
     # Print info
@@ -133,17 +170,22 @@ def run_tests(suites: list, coverage: bool = False, verbose: int = 1):
     
     # Run tests
     start_time = time.time()
-    result = subprocess.run(cmd)
+    if isolated:
+        returncode = subprocess.run(cmd).returncode
+    else:
+        # Same arguments, minus "python -m pytest", without a new interpreter
+        import pytest
+        returncode = int(pytest.main(cmd[3:]))
     elapsed = time.time() - start_time
     
     # Print summary
     print()
     print("=" * 70)
     print(f"COMPLETED in {elapsed:.1f} seconds")
-    print(f"Exit code: {result.returncode}")
+    print(f"Exit code: {returncode}")
     print("=" * 70)
     
-    return result.returncode
+    return returncode
 
 
 def main():
@@ -165,6 +207,9 @@ Examples:
   %(prog)s full                     # Run everything
   %(prog)s strategy identity        # Run specific suites
   %(prog)s --coverage full          # Run with coverage
+  %(prog)s --workers 0 full         # Run serially
+  %(prog)s --isolated smoke         # Run pytest in a subprocess
+  %(prog)s --fresh full             # Ignore previous failures
         """,
     )
     
@@ -188,6 +233,24 @@ Examples:
         help="Increase verbosity (can be used multiple times)",
     )
     
+    parser.add_argument(
+        "-n", "--workers",
+        default="auto",
+        help="pytest-xdist worker count, 'auto', or 0 for serial (default: auto)",
+    )
+    
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run pytest in a separate process instead of in-process",
+    )
+    
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Clear pytest's cache so previous failures are not run first",
+    )
+    
     parser.add_argument(
         "--list",
         action="store_true",
@@ -203,7 +266,9 @@ Examples:
             print(f"  {name:12} - {info['description']} ({info['estimated_time']})")
         return 0
     
-    return run_tests(args.suites, args.coverage, args.verbose)
+    return run_tests(
+        args.suites, args.coverage, args.verbose, args.workers, args.isolated, args.fresh
+    )
 
 
 if __name__ == "__main__":
@@ -4,14 +4,20 @@
 This script runs a subset of behavioral tests using Ollama instead of mocks.
 
 NOTE: This is a standalone script, not a pytest test module.
-Run with: python tests/behavioral/run_real_llm_tests.py
+Run with: python tests/behavioral/run_real_llm_tests.py [model] [--sequential] [--quiet]
 """
 
+import argparse
 import asyncio
+import io
+import json
+import os
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import httpx
@@ -28,22 +34,72 @@ from src.cognitive.models import Thought, ThoughtType, CognitiveResult
 from src.cognitive.prompts import TieredPromptBuilder
 from src.cognitive.tiers import TIER_CONFIGS
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser works the same
+    _json_loads = json.loads
+
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:  # uvloop comes with uvicorn[standard], except on Windows
+    _loop_factory = None
+
 
 # ============================================================================
 # Simplified Ollama Client (direct, no router overhead)
 # ============================================================================
 
+# How long Ollama keeps the model loaded after each request, so repeated
+# runs of this script find it already resident
+_KEEP_ALIVE = "30m"
+
+# Requests the server decodes at once; Ollama queues any beyond this
+_OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+
 class SimpleOllamaClient:
     """Simple async client for Ollama - bypasses router timeouts for testing."""
 
-    def __init__(self, model_name: str = "qwen2.5:3b", base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model_name: str = "qwen2.5:3b",
+        base_url: str = "http://localhost:11434",
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_parallel: int = _OLLAMA_NUM_PARALLEL,
+        enable_dedupe: bool = False,
+    ):
+        """Initialize the client.
+
+        Args:
+            model_name: Ollama model to use
+            base_url: Ollama server URL
+            http_client: Optional shared client to send requests through.
+                It is left open by close(); by default the client creates
+                and owns its own pool.
+            max_parallel: Most generate requests in flight at once. Defaults
+                to OLLAMA_NUM_PARALLEL from the environment, or 4, so
+                requests wait here rather than in the server's queue.
+            enable_dedupe: Let concurrent identical generate calls share one
+                request and one response. Off by default, since sampled
+                calls are expected to differ.
+        """
         self.model_name = model_name
         self.base_url = base_url
-        self._client: Optional[httpx.AsyncClient] = None
+        self._slots = asyncio.Semaphore(max_parallel)
+        self.enable_dedupe = enable_dedupe
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=httpx.Timeout(120.0))  # Long timeout
+            # Pooled keep-alive connections so concurrent tests reuse sockets
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+                timeout=httpx.Timeout(120.0),  # Long timeout
+            )
         return self._client
 
     async def generate(
@@ -51,26 +107,146 @@ class SimpleOllamaClient:
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.7,
+        early_stop: Optional[Callable[[str], bool]] = None,
+        context: Optional[List[int]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict:
-        """Generate completion from Ollama."""
+        """Generate completion from Ollama.
+
+        The response is streamed. If early_stop returns True for the text
+        received so far, generation is abandoned and the partial text is
+        returned with "done" set to False.
+
+        context is the "context" list from an earlier completed response.
+        Ollama then continues that exchange, so the model sees the earlier
+        prompt and answer; only pass it for genuine follow-ups.
+
+        timeout, in seconds, replaces the client's default for this request
+        and is enforced by httpx on the connection itself.
+
+        With enable_dedupe, a call matching one still in flight (same prompt,
+        max_tokens and temperature, without early_stop or context) waits for
+        that request instead of sending its own.
+        """
+        if not self.enable_dedupe or early_stop is not None or context is not None:
+            return await self._generate(
+                prompt, max_tokens, temperature, early_stop, context, timeout
+            )
+
+        key = (prompt, max_tokens, temperature)
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._generate(prompt, max_tokens, temperature, None, None, timeout)
+            )
+            self._inflight[key] = request
+            request.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the others
+        return dict(await asyncio.shield(request))
+
+    async def _generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        early_stop: Optional[Callable[[str], bool]],
+        context: Optional[List[int]],
+        timeout: Optional[float],
+    ) -> Dict:
+        """Send one streamed generate request; see generate."""
         client = await self._ensure_client()
 
         payload = {
             "model": self.model_name,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
+            "keep_alive": _KEEP_ALIVE,
             "options": {
                 "num_predict": max_tokens,
                 "temperature": temperature,
             },
         }
+        if context is not None:
+            payload["context"] = context
+
+        content = ""
+        chunk_count = 0
+        async with self._slots, client.stream(
+            "POST",
+            f"{self.base_url}/api/generate",
+            json=payload,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                content += chunk.get("response", "")
+                chunk_count += 1
+                if chunk.get("done"):
+                    # Final chunk carries the token counts and timings
+                    return {**chunk, "response": content}
+                if early_stop is not None and early_stop(content):
+                    break
+
+        # Stopped early (or the stream ended without a final chunk); each
+        # streamed chunk is roughly one token
+        return {"response": content, "done": False, "eval_count": chunk_count}
+
+    async def is_loaded(self) -> bool:
+        """Check whether Ollama already has this model in memory."""
+        client = await self._ensure_client()
+        response = await client.get(f"{self.base_url}/api/ps", timeout=5.0)
+        response.raise_for_status()
+        return any(
+            m.get("name") == self.model_name or m.get("model") == self.model_name
+            for m in response.json().get("models", [])
+        )
 
-        response = await client.post(f"{self.base_url}/api/generate", json=payload)
+    async def warmup(self, prompt: str) -> None:
+        """Load the model and evaluate prompt, generating a single token.
+
+        Ollama keeps the evaluated prompt cached, so later requests that
+        start with the same text skip re-processing that prefix.
+        """
+        client = await self._ensure_client()
+        response = await client.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model_name,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": _KEEP_ALIVE,
+                "options": {"num_predict": 1},
+            },
+        )
+        response.raise_for_status()
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+    ) -> List[Dict]:
+        """Generate completions for several prompts at once.
+
+        The requests are sent concurrently so Ollama can schedule them
+        together; results are returned in prompt order.
+        """
+        return list(await asyncio.gather(
+            *(self.generate(prompt, max_tokens, temperature) for prompt in prompts)
+        ))
+
+    async def list_models(self) -> List[str]:
+        """List the names of the models available on the server."""
+        client = await self._ensure_client()
+        response = await client.get(f"{self.base_url}/api/tags", timeout=5.0)
         response.raise_for_status()
-        return response.json()
+        return [m["name"] for m in response.json().get("models", [])]
 
     async def close(self):
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -81,6 +257,7 @@ class SimpleOllamaClient:
 
 def create_backend_expert() -> AgentProfile:
     """Create Marcus - a senior backend expert."""
+    now = datetime.now()
     return AgentProfile(
         agent_id=uuid4(),
         name="Marcus",
@@ -131,13 +308,14 @@ def create_backend_expert() -> AgentProfile:
         ),
         knowledge_domains=["databases", "api_design", "performance_optimization", "python"],
         knowledge_gaps=["frontend", "mobile_development"],
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
 
 
 def create_frontend_designer() -> AgentProfile:
     """Create Maya - a creative frontend designer."""
+    now = datetime.now()
     return AgentProfile(
         agent_id=uuid4(),
         name="Maya",
@@ -188,8 +366,8 @@ def create_frontend_designer() -> AgentProfile:
         ),
         knowledge_domains=["ui_design", "user_experience", "accessibility", "design_systems"],
         knowledge_gaps=["backend", "databases", "devops"],
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=now,
+        updated_at=now,
     )
 
 
@@ -197,52 +375,89 @@ def create_frontend_designer() -> AgentProfile:
 # Simple Cognitive Processor (for testing)
 # ============================================================================
 
+# Substrings used to classify responses (see _infer_thought_type) and to
+# spot database expertise in test_expert_domain_response
+_CONCERN_WORDS = ("concern", "risk", "worry", "careful")
+_PLAN_WORDS = ("should", "could", "plan", "recommend")
+_DATABASE_TERMS = ("index", "query", "join", "explain", "table", "column", "performance")
+
+# Confidence estimate inputs for SimpleCognitiveProcessor.process
+_HEDGING_WORDS = ("maybe", "perhaps", "might", "possibly", "uncertain")
+_BASE_CONFIDENCE = {
+    CognitiveTier.REFLEX: 0.5,
+    CognitiveTier.REACTIVE: 0.6,
+    CognitiveTier.DELIBERATE: 0.75,
+    CognitiveTier.ANALYTICAL: 0.85,
+    CognitiveTier.COMPREHENSIVE: 0.9,
+}
+
+
+# Built prompts, shared across processors. Keyed on the agent's updated_at
+# so a profile that is saved with changes gets fresh prompts.
+_PROMPT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_PROMPT_CACHE_SIZE = 256
+
+
 class SimpleCognitiveProcessor:
     """Simplified cognitive processor for testing with real LLM."""
 
-    def __init__(self, agent: AgentProfile, ollama_client: SimpleOllamaClient):
+    __slots__ = ("agent", "client", "max_stimulus_chars")
+
+    # Stateless, so one builder serves every processor
+    prompt_builder = TieredPromptBuilder()
+
+    def __init__(
+        self,
+        agent: AgentProfile,
+        ollama_client: SimpleOllamaClient,
+        max_stimulus_chars: Optional[int] = 8192,
+    ):
+        """Initialize the processor.
+
+        Args:
+            agent: The agent profile to respond as
+            ollama_client: Client used for generation
+            max_stimulus_chars: Stimuli longer than this are cut before the
+                prompt is built, so oversized inputs do not pay for prefill
+                the model's context would drop anyway. None sends them whole.
+        """
         self.agent = agent
         self.client = ollama_client
-        self.prompt_builder = TieredPromptBuilder()
+        self.max_stimulus_chars = max_stimulus_chars
 
     async def process(
         self,
         stimulus: str,
         tier: CognitiveTier,
         purpose: str = "response",
+        early_stop: Optional[Callable[[str], bool]] = None,
     ) -> Thought:
-        """Process stimulus with specified tier."""
+        """Process stimulus with specified tier.
+
+        early_stop is passed through to the client to cut generation short.
+        """
         config = TIER_CONFIGS[tier]
 
-        # Build prompt
-        prompt = self.prompt_builder.build(
-            tier=tier,
-            agent=self.agent,
-            stimulus=stimulus,
-            purpose=purpose,
-            context={},
-        )
+        if self.max_stimulus_chars is not None:
+            stimulus = stimulus[:self.max_stimulus_chars]
+
+        prompt = self._build_prompt(stimulus, tier, purpose)
 
         # Generate response
         result = await self.client.generate(
             prompt=prompt,
             max_tokens=config.max_tokens,
             temperature=0.7,
+            early_stop=early_stop,
         )
 
         content = result.get("response", "")
         completion_tokens = result.get("eval_count", 0)
 
         # Estimate confidence
-        hedging_words = ["maybe", "perhaps", "might", "possibly", "uncertain"]
-        hedging_count = sum(1 for word in hedging_words if word in content.lower())
-        base_confidence = {
-            CognitiveTier.REFLEX: 0.5,
-            CognitiveTier.REACTIVE: 0.6,
-            CognitiveTier.DELIBERATE: 0.75,
-            CognitiveTier.ANALYTICAL: 0.85,
-            CognitiveTier.COMPREHENSIVE: 0.9,
-        }[tier]
+        content_lower = content.lower()
+        hedging_count = sum(1 for word in _HEDGING_WORDS if word in content_lower)
+        base_confidence = _BASE_CONFIDENCE[tier]
         confidence = max(0.3, base_confidence - min(hedging_count * 0.05, 0.15))
 
         # Estimate completeness
@@ -260,22 +475,69 @@ class SimpleCognitiveProcessor:
             thought_id=uuid4(),
             tier=tier,
             content=content.strip(),
-            thought_type=self._infer_thought_type(content, purpose),
+            thought_type=self._infer_thought_type(content, purpose, content_lower),
             trigger=purpose,
             confidence=confidence,
             completeness=completeness,
         )
 
-    def _infer_thought_type(self, content: str, purpose: str) -> ThoughtType:
-        """Infer thought type from content."""
-        content_lower = content.lower()
-        if any(word in content_lower for word in ["concern", "risk", "worry", "careful"]):
+    async def process_batch(
+        self,
+        requests: List[Tuple[str, CognitiveTier, str]],
+    ) -> List[Thought]:
+        """Process several (stimulus, tier, purpose) requests at once.
+
+        Each request keeps its own tier's token budget. The calls are sent
+        concurrently and thoughts are returned in request order.
+        """
+        return list(await asyncio.gather(
+            *(self.process(stimulus, tier, purpose) for stimulus, tier, purpose in requests)
+        ))
+
+    def _build_prompt(self, stimulus: str, tier: CognitiveTier, purpose: str) -> str:
+        """Build the prompt for a call, reusing one built earlier if possible.
+
+        Prompts are built with an empty context, so the agent, tier,
+        stimulus and purpose fully determine them.
+        """
+        key = (self.agent.agent_id, self.agent.updated_at, tier, stimulus, purpose)
+        prompt = _PROMPT_CACHE.get(key)
+        if prompt is not None:
+            _PROMPT_CACHE.move_to_end(key)
+            return prompt
+
+        prompt = self.prompt_builder.build(
+            tier=tier,
+            agent=self.agent,
+            stimulus=stimulus,
+            purpose=purpose,
+            context={},
+        )
+        _PROMPT_CACHE[key] = prompt
+        if len(_PROMPT_CACHE) > _PROMPT_CACHE_SIZE:
+            _PROMPT_CACHE.popitem(last=False)
+        return prompt
+
+    def _infer_thought_type(
+        self,
+        content: str,
+        purpose: str,
+        content_lower: Optional[str] = None,
+    ) -> ThoughtType:
+        """Infer thought type from content.
+
+        content_lower may be passed in when the caller has already
+        lowercased the content.
+        """
+        if content_lower is None:
+            content_lower = content.lower()
+        if any(word in content_lower for word in _CONCERN_WORDS):
             return ThoughtType.CONCERN
         if "?" in content:
             return ThoughtType.QUESTION
         if purpose == "immediate_response":
             return ThoughtType.REACTION
-        if any(word in content_lower for word in ["should", "could", "plan", "recommend"]):
+        if any(word in content_lower for word in _PLAN_WORDS):
             return ThoughtType.PLAN
         return ThoughtType.INSIGHT
 
@@ -284,6 +546,11 @@ class SimpleCognitiveProcessor:
 # Test Cases
 # ============================================================================
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
 @dataclass
 class LLMTestResult:
     """Result of a single LLM test case (renamed to avoid pytest collection)."""
@@ -296,14 +563,14 @@ class LLMTestResult:
 
 async def test_basic_response(processor: SimpleCognitiveProcessor) -> LLMTestResult:
     """Test basic stimulus response."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         thought = await processor.process(
             stimulus="Hello! How are you today?",
             tier=CognitiveTier.REACTIVE,
             purpose="greeting",
         )
-        duration = (time.time() - start) * 1000
+        duration = _elapsed_ms(start)
 
         passed = len(thought.content) > 10
         details = (
@@ -314,21 +581,23 @@ async def test_basic_response(processor: SimpleCognitiveProcessor) -> LLMTestRes
         )
         return LLMTestResult("Basic Response", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("Basic Response", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("Basic Response", False, _elapsed_ms(start), "", str(e))
 
 
 async def test_reflex_is_brief(processor: SimpleCognitiveProcessor) -> LLMTestResult:
     """Test that REFLEX tier produces brief responses."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         thought = await processor.process(
             stimulus="URGENT: Server alert!",
             tier=CognitiveTier.REFLEX,
             purpose="immediate_response",
+            # 100 words already fails the check below, so stop generating
+            early_stop=lambda text: len(text.split()) >= 100,
         )
-        duration = (time.time() - start) * 1000
+        duration = _elapsed_ms(start)
 
-        word_count = len(thought.content.split())
+        word_count = thought.word_count
         # REFLEX should be concise (< 50 words typically)
         passed = 5 < word_count < 100
         details = (
@@ -338,21 +607,21 @@ async def test_reflex_is_brief(processor: SimpleCognitiveProcessor) -> LLMTestRe
         )
         return LLMTestResult("REFLEX is Brief", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("REFLEX is Brief", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("REFLEX is Brief", False, _elapsed_ms(start), "", str(e))
 
 
 async def test_deliberate_is_thorough(processor: SimpleCognitiveProcessor) -> LLMTestResult:
     """Test that DELIBERATE tier produces thorough responses."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         thought = await processor.process(
             stimulus="What are the tradeoffs between SQL and NoSQL databases?",
             tier=CognitiveTier.DELIBERATE,
             purpose="analysis",
         )
-        duration = (time.time() - start) * 1000
+        duration = _elapsed_ms(start)
 
-        word_count = len(thought.content.split())
+        word_count = thought.word_count
         # DELIBERATE should be more thorough (> 50 words typically)
         passed = word_count > 30
         details = (
@@ -363,12 +632,12 @@ async def test_deliberate_is_thorough(processor: SimpleCognitiveProcessor) -> LL
         )
         return LLMTestResult("DELIBERATE is Thorough", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("DELIBERATE is Thorough", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("DELIBERATE is Thorough", False, _elapsed_ms(start), "", str(e))
 
 
 async def test_expert_domain_response(processor: SimpleCognitiveProcessor) -> LLMTestResult:
     """Test expert responds well to domain questions."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         # Marcus is a database expert
         thought = await processor.process(
@@ -376,11 +645,10 @@ async def test_expert_domain_response(processor: SimpleCognitiveProcessor) -> LL
             tier=CognitiveTier.DELIBERATE,
             purpose="technical_advice",
         )
-        duration = (time.time() - start) * 1000
+        duration = _elapsed_ms(start)
 
         # Check for technical content
-        technical_terms = ["index", "query", "join", "explain", "table", "column", "performance"]
-        has_technical = any(term in thought.content.lower() for term in technical_terms)
+        has_technical = any(term in thought.content_lower for term in _DATABASE_TERMS)
 
         passed = has_technical and thought.confidence >= 0.6
         details = (
@@ -391,7 +659,7 @@ async def test_expert_domain_response(processor: SimpleCognitiveProcessor) -> LL
         )
         return LLMTestResult("Expert Domain Response", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("Expert Domain Response", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("Expert Domain Response", False, _elapsed_ms(start), "", str(e))
 
 
 async def test_different_agents_differ(
@@ -399,29 +667,31 @@ async def test_different_agents_differ(
     maya_processor: SimpleCognitiveProcessor,
 ) -> LLMTestResult:
     """Test that different agents produce different responses."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         stimulus = "What do you think makes a good user interface?"
 
-        marcus_thought = await marcus_processor.process(
-            stimulus=stimulus,
-            tier=CognitiveTier.REACTIVE,
-            purpose="opinion",
-        )
-        maya_thought = await maya_processor.process(
-            stimulus=stimulus,
-            tier=CognitiveTier.REACTIVE,
-            purpose="opinion",
+        marcus_thought, maya_thought = await asyncio.gather(
+            marcus_processor.process(
+                stimulus=stimulus,
+                tier=CognitiveTier.REACTIVE,
+                purpose="opinion",
+            ),
+            maya_processor.process(
+                stimulus=stimulus,
+                tier=CognitiveTier.REACTIVE,
+                purpose="opinion",
+            ),
         )
-        duration = (time.time() - start) * 1000
+        duration = _elapsed_ms(start)
 
         # Responses should be different
         different = marcus_thought.content != maya_thought.content
 
         # Maya (designer) might mention design terms more
         design_terms = ["design", "user", "visual", "experience", "interface", "aesthetic"]
-        marcus_design_count = sum(1 for t in design_terms if t in marcus_thought.content.lower())
-        maya_design_count = sum(1 for t in design_terms if t in maya_thought.content.lower())
+        marcus_design_count = sum(1 for t in design_terms if t in marcus_thought.content_lower)
+        maya_design_count = sum(1 for t in design_terms if t in maya_thought.content_lower)
 
         passed = different
         details = (
@@ -434,26 +704,20 @@ async def test_different_agents_differ(
         )
         return LLMTestResult("Different Agents Differ", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("Different Agents Differ", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("Different Agents Differ", False, _elapsed_ms(start), "", str(e))
 
 
 async def test_tier_depth_varies(processor: SimpleCognitiveProcessor) -> LLMTestResult:
     """Test that different tiers produce different depth of response."""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         stimulus = "What is REST API?"
 
-        reflex_thought = await processor.process(
-            stimulus=stimulus,
-            tier=CognitiveTier.REFLEX,
-            purpose="quick_answer",
-        )
-        deliberate_thought = await processor.process(
-            stimulus=stimulus,
-            tier=CognitiveTier.DELIBERATE,
-            purpose="detailed_answer",
-        )
-        duration = (time.time() - start) * 1000
+        reflex_thought, deliberate_thought = await processor.process_batch([
+            (stimulus, CognitiveTier.REFLEX, "quick_answer"),
+            (stimulus, CognitiveTier.DELIBERATE, "detailed_answer"),
+        ])
+        duration = _elapsed_ms(start)
 
         reflex_len = len(reflex_thought.content)
         deliberate_len = len(deliberate_thought.content)
@@ -470,15 +734,28 @@ async def test_tier_depth_varies(processor: SimpleCognitiveProcessor) -> LLMTest
         )
         return LLMTestResult("Tier Depth Varies", passed, duration, details)
     except Exception as e:
-        return LLMTestResult("Tier Depth Varies", False, (time.time() - start) * 1000, "", str(e))
+        return LLMTestResult("Tier Depth Varies", False, _elapsed_ms(start), "", str(e))
 
 
 # ============================================================================
 # Main Test Runner
 # ============================================================================
 
-async def run_all_tests(model_name: str = "qwen2.5:3b"):
-    """Run all behavioral tests with real LLM."""
+async def run_all_tests(
+    model_name: str = "qwen2.5:3b",
+    concurrent: bool = True,
+    max_concurrent: int = _OLLAMA_NUM_PARALLEL,
+    quiet: bool = False,
+):
+    """Run all behavioral tests with real LLM.
+
+    The tests are independent, so by default up to max_concurrent of them
+    run at once and their requests overlap; pass concurrent=False to run
+    them one by one. Ollama queues requests beyond its OLLAMA_NUM_PARALLEL
+    setting, so per-test durations include any time spent waiting in that
+    queue. Each test catches its own errors, so one failure does not stop
+    the others. quiet leaves out the per-test details after the summary.
+    """
 
     print("=" * 70)
     print("COGNITIVE AGENT ENGINE - REAL LLM TEST SUITE")
@@ -486,34 +763,59 @@ async def run_all_tests(model_name: str = "qwen2.5:3b"):
     print("=" * 70)
     print()
 
-    # Check Ollama connection
+    # Create shared Ollama client; the connection check and every test
+    # reuse its connection pool
+    ollama = SimpleOllamaClient(model_name=model_name)
+
+    # Check Ollama connection, and whether the model is already loaded
     print("Checking Ollama connection...")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:11434/api/tags", timeout=5.0)
-            if response.status_code != 200:
-                print("ERROR: Ollama is not responding")
-                return False
-            models = [m["name"] for m in response.json().get("models", [])]
-            print(f"Available models: {', '.join(models)}")
-            if not any(model_name in m for m in models):
-                print(f"WARNING: {model_name} not found")
+        models, loaded = await asyncio.gather(
+            ollama.list_models(), ollama.is_loaded(), return_exceptions=True
+        )
+        if isinstance(models, BaseException):
+            raise models
+        print(f"Available models: {', '.join(models)}")
+        if not any(model_name in m for m in models):
+            print(f"WARNING: {model_name} not found")
+    except httpx.HTTPStatusError:
+        print("ERROR: Ollama is not responding")
+        await ollama.close()
+        return False
     except Exception as e:
         print(f"ERROR: Cannot connect to Ollama: {e}")
+        await ollama.close()
         return False
 
     print()
 
-    # Create shared Ollama client
-    ollama = SimpleOllamaClient(model_name=model_name)
+    # Create processors
+    marcus = create_backend_expert()
+    maya = create_frontend_designer()
+
+    marcus_processor = SimpleCognitiveProcessor(marcus, ollama)
+    maya_processor = SimpleCognitiveProcessor(maya, ollama)
 
-    # Warm up the model (first request is slow)
-    print("Warming up model (first request may be slow)...")
+    # Warm up the model (first request is slow) unless a previous run left
+    # it loaded. The warmup prompt is a real test prompt so its prefix is
+    # cached for the tests that follow.
+    # Only /api/tags is required; if /api/ps fails (older Ollama versions
+    # lack it), treat the model as not loaded and warm it up
+    if isinstance(loaded, BaseException):
+        loaded = False
     try:
-        warmup_start = time.time()
-        warmup = await ollama.generate("Hello", max_tokens=10)
-        warmup_time = time.time() - warmup_start
-        print(f"Model ready ({warmup_time:.1f}s warmup)")
+        if loaded:
+            print("Model already loaded, skipping warmup")
+        else:
+            print("Warming up model (first request may be slow)...")
+            warmup_start = time.perf_counter_ns()
+            await ollama.warmup(
+                marcus_processor._build_prompt(
+                    "Hello! How are you today?", CognitiveTier.REACTIVE, "greeting"
+                )
+            )
+            warmup_time = _elapsed_ms(warmup_start) / 1000
+            print(f"Model ready ({warmup_time:.1f}s warmup)")
     except Exception as e:
         print(f"ERROR: Failed to warm up model: {e}")
         await ollama.close()
@@ -521,13 +823,6 @@ async def run_all_tests(model_name: str = "qwen2.5:3b"):
 
     print()
 
-    # Create processors
-    marcus = create_backend_expert()
-    maya = create_frontend_designer()
-
-    marcus_processor = SimpleCognitiveProcessor(marcus, ollama)
-    maya_processor = SimpleCognitiveProcessor(maya, ollama)
-
     # Run tests
     results: List[LLMTestResult] = []
 
@@ -545,9 +840,25 @@ async def run_all_tests(model_name: str = "qwen2.5:3b"):
         ("6. Tier Depth Varies", lambda: test_tier_depth_varies(marcus_processor)),
     ]
 
-    for name, test_fn in tests:
+    suite_start = time.perf_counter_ns()
+    if concurrent:
+        print(f"Starting {len(tests)} tests, up to {max_concurrent} at a time...")
+        print()
+        limit = asyncio.Semaphore(max_concurrent)
+
+        async def run_limited(test_fn):
+            async with limit:
+                return await test_fn()
+
+        outcomes = await asyncio.gather(*(run_limited(test_fn) for _, test_fn in tests))
+    else:
+        outcomes = []
+        for name, test_fn in tests:
+            outcomes.append(await test_fn())
+    wall_time = _elapsed_ms(suite_start)
+
+    for (name, _), result in zip(tests, outcomes):
         print(f"{name}...")
-        result = await test_fn()
         results.append(result)
         status = "✓ PASSED" if result.passed else "✗ FAILED"
         print(f"   {status} ({result.duration_ms:.0f}ms)")
@@ -560,26 +871,31 @@ async def run_all_tests(model_name: str = "qwen2.5:3b"):
     print("TEST SUMMARY")
     print("=" * 70)
 
-    passed = sum(1 for r in results if r.passed)
+    passed = 0
+    total_time = 0.0
+    for r in results:
+        passed += r.passed
+        total_time += r.duration_ms
     total = len(results)
-    total_time = sum(r.duration_ms for r in results)
 
     print(f"Passed: {passed}/{total} ({100*passed/total:.0f}%)")
-    print(f"Total time: {total_time/1000:.2f}s")
+    print(f"Total time: {total_time/1000:.2f}s (wall clock {wall_time/1000:.2f}s)")
     print()
 
-    # Detailed results
-    print("-" * 70)
-    print("DETAILED RESULTS")
-    print("-" * 70)
-    for result in results:
-        status = "✓ PASSED" if result.passed else "✗ FAILED"
-        print(f"\n{status}: {result.name}")
-        print(f"Duration: {result.duration_ms:.0f}ms")
-        if result.details:
-            print(f"Details:\n{result.details}")
-        if result.error:
-            print(f"Error: {result.error}")
+    # Detailed results, written in one go since details hold whole LLM
+    # responses; a fully passing CI run only needs the summary
+    if not quiet and (passed < total or not os.getenv("CI")):
+        report = io.StringIO()
+        report.write("-" * 70 + "\nDETAILED RESULTS\n" + "-" * 70 + "\n")
+        for result in results:
+            status = "✓ PASSED" if result.passed else "✗ FAILED"
+            report.write(f"\n{status}: {result.name}\n")
+            report.write(f"Duration: {result.duration_ms:.0f}ms\n")
+            if result.details:
+                report.write(f"Details:\n{result.details}\n")
+            if result.error:
+                report.write(f"Error: {result.error}\n")
+        sys.stdout.write(report.getvalue())
 
     # Cleanup
     await ollama.close()
@@ -588,8 +904,17 @@ async def run_all_tests(model_name: str = "qwen2.5:3b"):
 
 
 if __name__ == "__main__":
-    import sys
-
-    model = sys.argv[1] if len(sys.argv) > 1 else "qwen2.5:3b"
-    success = asyncio.run(run_all_tests(model))
+    parser = argparse.ArgumentParser(description="Run behavioral tests against a real Ollama model")
+    parser.add_argument("model", nargs="?", default="qwen2.5:3b", help="Ollama model name")
+    parser.add_argument("--model", dest="model_option", metavar="MODEL", help="Ollama model name")
+    parser.add_argument("--sequential", action="store_true", help="Run tests one at a time")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Print only the summary")
+    args = parser.parse_args()
+
+    with asyncio.Runner(loop_factory=_loop_factory) as runner:
+        success = runner.run(run_all_tests(
+            args.model_option or args.model,
+            concurrent=not args.sequential,
+            quiet=args.quiet,
+        ))
     sys.exit(0 if success else 1)
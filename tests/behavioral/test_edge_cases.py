@@ -14,15 +14,23 @@ Tests for boundary conditions, error handling, and unusual inputs:
 import pytest
 import asyncio
 from datetime import datetime
-from typing import List, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, List, Dict
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
-from conftest import (
+from src.cognitive import CognitiveProcessor, CognitiveTier
+from tests.behavioral.conftest import (
     create_processor_with_mock_router,
 )
 
 
+# Oversized inputs, built once at import rather than in each test
+_LONG_STIMULUS = "This is a test. " * 500  # ~2500 words
+_EXTREME_STIMULUS = "word " * 10000  # ~50000 characters
+_LONG_WORD = "a" * 1000  # 1000 character word
+
+
 # =============================================================================
 # EMPTY AND MINIMAL INPUT TESTS
 # =============================================================================
@@ -64,13 +72,17 @@ class TestEmptyInputs:
         """Single character stimulus should be handled."""
         single_chars = ["?", "!", ".", "a", "1", "@"]
         
-        for char in single_chars:
-            result = await processor_for_alex.process(
+        results = await asyncio.gather(*(
+            processor_for_alex.process(
                 stimulus=char,
                 urgency=0.5,
                 complexity=0.5,
                 relevance=0.5,
             )
+            for char in single_chars
+        ))
+        
+        for char, result in zip(single_chars, results):
             assert result is not None, f"Failed on character: {char}"
 
 
@@ -84,10 +96,8 @@ class TestLongInputs:
     @pytest.mark.asyncio
     async def test_long_stimulus(self, processor_for_alex):
         """Very long stimulus should be handled (possibly truncated)."""
-        long_stimulus = "This is a test. " * 500  # ~2500 words
-        
         result = await processor_for_alex.process(
-            stimulus=long_stimulus,
+            stimulus=_LONG_STIMULUS,
             urgency=0.3,
             complexity=0.5,
             relevance=0.7,
@@ -101,18 +111,14 @@ class TestLongInputs:
     @pytest.mark.asyncio
     async def test_extremely_long_stimulus(self, processor_for_alex):
         """Extremely long stimulus should not hang."""
-        extreme_stimulus = "word " * 10000  # ~50000 characters
-        
         try:
-            result = await asyncio.wait_for(
-                processor_for_alex.process(
-                    stimulus=extreme_stimulus,
+            async with asyncio.timeout(30.0):
+                result = await processor_for_alex.process(
+                    stimulus=_EXTREME_STIMULUS,
                     urgency=0.5,
                     complexity=0.5,
                     relevance=0.5,
-                ),
-                timeout=30.0
-            )
+                )
             assert result is not None
         except asyncio.TimeoutError:
             pytest.fail("Extremely long stimulus caused timeout")
@@ -120,10 +126,8 @@ class TestLongInputs:
     @pytest.mark.asyncio
     async def test_long_single_word(self, processor_for_alex):
         """Very long single word should be handled."""
-        long_word = "a" * 1000  # 1000 character word
-        
         result = await processor_for_alex.process(
-            stimulus=long_word,
+            stimulus=_LONG_WORD,
             urgency=0.5,
             complexity=0.5,
             relevance=0.5,
@@ -179,13 +183,17 @@ class TestSpecialCharacters:
             "Test${variable}",  # Template syntax
         ]
         
-        for stimulus in special_stimuli:
-            result = await processor_for_alex.process(
+        results = await asyncio.gather(*(
+            processor_for_alex.process(
                 stimulus=stimulus,
                 urgency=0.5,
                 complexity=0.5,
                 relevance=0.5,
             )
+            for stimulus in special_stimuli
+        ))
+        
+        for stimulus, result in zip(special_stimuli, results):
             assert result is not None, f"Failed on: {repr(stimulus)}"
 
 
@@ -295,48 +303,82 @@ class TestParameterBoundaries:
 # ERROR HANDLING TESTS
 # =============================================================================
 
+class _StubRouter:
+    """Plain stand-in for a model router, replaying scripted outcomes.
+
+    Each route() call takes the next side effect: exceptions are raised,
+    anything else is returned. delay is awaited before every call.
+    """
+
+    def __init__(self, side_effects: List[Any], delay: float = 0.0):
+        self.side_effects = list(side_effects)
+        self.delay = delay
+        self.call_count = 0
+
+    async def route(self, *args, **kwargs):
+        self.call_count += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        outcome = self.side_effects.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
 class TestErrorHandling:
     """Tests for error handling in various failure scenarios."""
 
     @pytest.mark.asyncio
     async def test_model_timeout_fallback(self, alex_chen):
         """Model timeout should trigger fallback."""
-        # Create processor with mock that times out
-        mock_router = MagicMock()
-        
-        async def slow_route(*args, **kwargs):
-            await asyncio.sleep(10)  # Simulate slow response
-            raise asyncio.TimeoutError("Model timeout")
+        # Create router stub that times out
+        mock_router = _StubRouter(
+            [asyncio.TimeoutError("Model timeout")],
+            delay=0.05,  # Simulate slow response
+        )
+        processor = CognitiveProcessor(agent=alex_chen, model_router=mock_router)
         
-        mock_router.route = slow_route
+        # Medium scenario: a single REACTIVE call, which times out
+        result = await processor.process(
+            stimulus="Can you take a look at this?",
+            urgency=0.5,
+            complexity=0.3,
+            relevance=0.7,
+        )
         
-        # Note: This test verifies the pattern, actual implementation
-        # should handle this gracefully
-        # For now, just verify structure
-        assert mock_router is not None
+        # The timeout is absorbed: an empty result rather than an exception
+        assert mock_router.call_count == 1
+        assert result.thoughts == []
+        assert result.primary_thought is None
+        assert result.agent_id == alex_chen.agent_id
+        assert result.processing_time_ms >= 50
 
     @pytest.mark.asyncio
     async def test_graceful_degradation_on_error(self, alex_chen):
         """Errors should degrade gracefully, not crash."""
-        mock_router = MagicMock()
-        
-        call_count = [0]
-        
-        async def failing_route(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise Exception("First call fails")
-            # Second call succeeds
-            return MagicMock(
-                text="Fallback response",
-                completion_tokens=50,
-            )
-        
-        mock_router.route = failing_route
+        fallback = SimpleNamespace(text="Fallback response", completion_tokens=50)
+        mock_router = _StubRouter([
+            Exception("First call fails"),
+            # Both parallel REACTIVE calls succeed
+            fallback,
+            fallback,
+        ])
+        processor = CognitiveProcessor(agent=alex_chen, model_router=mock_router)
+        
+        # Urgent scenario: REFLEX (fails), then two parallel REACTIVE calls
+        result = await processor.process(
+            stimulus="The deploy is failing!",
+            urgency=0.9,
+            complexity=0.2,
+            relevance=0.9,
+        )
         
-        # Test would verify processor handles first failure
-        # and retries or falls back
-        assert True  # Placeholder for actual test
+        # The failed tier is skipped; the remaining thoughts still come back
+        assert mock_router.call_count == 3
+        assert len(result.thoughts) == 2
+        assert result.tiers_used == [CognitiveTier.REACTIVE]
+        assert result.primary_thought is not None
+        assert result.primary_thought.content == "Fallback response"
 
     @pytest.mark.asyncio
     async def test_invalid_context_handled(self, processor_for_alex):
@@ -534,13 +576,17 @@ class TestTierSelectionEdgeCases:
         # Test values right at threshold boundaries
         borderline_values = [0.29, 0.30, 0.31, 0.69, 0.70, 0.71]
         
-        for urgency in borderline_values:
-            result = await processor_for_alex.process(
+        results = await asyncio.gather(*(
+            processor_for_alex.process(
                 stimulus="Borderline test",
                 urgency=urgency,
                 complexity=0.5,
                 relevance=0.7,
             )
+            for urgency in borderline_values
+        ))
+        
+        for urgency, result in zip(borderline_values, results):
             assert result is not None, f"Failed at urgency {urgency}"
 
 
@@ -602,3 +648,22 @@ class TestIntegrationEdgeCases:
             relevance=0.9,
         )
         assert final_result.primary_thought is not None
+
+    @pytest.mark.asyncio
+    async def test_edited_profile_copy_leaves_shared_profile(self, alex_chen, fresh_profile):
+        """A processor for an edited profile copy should not alter the shared profile."""
+        profile = fresh_profile(alex_chen)
+        profile.skills.technical["python"] = 2
+        profile.knowledge_domains.append("frontend")
+        
+        result = await create_processor_with_mock_router(profile).process(
+            stimulus="How should we structure the Python services?",
+            urgency=0.5,
+            complexity=0.5,
+            relevance=0.8,
+        )
+        
+        assert result.primary_thought is not None
+        assert result.agent_id == profile.agent_id != alex_chen.agent_id
+        assert alex_chen.skills.technical["python"] == 9
+        assert "frontend" not in alex_chen.knowledge_domains
@@ -6,9 +6,11 @@ based on their skills, personality, and communication style.
 These tests prove that the "CV" (agent profile) actually influences behavior.
 """
 
+import asyncio
+
 import pytest
 
-from src.cognitive import CognitiveTier, create_processor_with_mock_router
+from src.cognitive import CognitiveTier
 # These are imported from the local conftest.py by pytest
 from tests.behavioral.conftest import (
     analyze_response_style,
@@ -18,6 +20,10 @@ from tests.behavioral.conftest import (
 )
 
 
+# Rigid structure markers a casual communicator should rarely use
+FORMAL_MARKERS = ("Therefore,", "Furthermore,", "In conclusion,", "To summarize,")
+
+
 class TestExpertiseInfluencesResponse:
     """Tests that agent expertise affects response content and confidence."""
 
@@ -40,7 +46,7 @@ class TestExpertiseInfluencesResponse:
         )
         
         # Response should be substantive (allowing for mock variation)
-        word_count = len(result.primary_thought.content.split())
+        word_count = result.primary_thought.word_count
         assert word_count >= 20, (
             f"Expert should have substantive opinion, got {word_count} words"
         )
@@ -80,7 +86,7 @@ class TestExpertiseInfluencesResponse:
         )
         
         # Response should be substantive (allowing for mock variation)
-        word_count = len(result.primary_thought.content.split())
+        word_count = result.primary_thought.word_count
         assert word_count >= 20, (
             f"Expert should have substantive opinion, got {word_count} words"
         )
@@ -92,18 +98,19 @@ class TestExpertiseInfluencesResponse:
         """Same question should get different responses from different experts."""
         stimulus = "What should we prioritize for the next sprint?"
         
-        alex_result = await processor_for_alex.process(
-            stimulus=stimulus,
-            urgency=0.4,
-            complexity=0.5,
-            relevance=0.7,
-        )
-        
-        maya_result = await processor_for_maya.process(
-            stimulus=stimulus,
-            urgency=0.4,
-            complexity=0.5,
-            relevance=0.7,
+        alex_result, maya_result = await asyncio.gather(
+            processor_for_alex.process(
+                stimulus=stimulus,
+                urgency=0.4,
+                complexity=0.5,
+                relevance=0.7,
+            ),
+            processor_for_maya.process(
+                stimulus=stimulus,
+                urgency=0.4,
+                complexity=0.5,
+                relevance=0.7,
+            ),
         )
         
         # Both should produce responses
@@ -111,8 +118,8 @@ class TestExpertiseInfluencesResponse:
         assert maya_result.primary_thought is not None
         
         # Responses should be different
-        alex_content = alex_result.primary_thought.content.lower()
-        maya_content = maya_result.primary_thought.content.lower()
+        alex_content = alex_result.primary_thought.content_lower
+        maya_content = maya_result.primary_thought.content_lower
         
         # Not identical (extremely unlikely with LLM, but verify)
         assert alex_content != maya_content, "Different agents should produce different responses"
@@ -132,7 +139,7 @@ class TestPersonalityInfluencesStyle:
         )
         
         hedging_count = count_hedging_words(result.primary_thought.content)
-        word_count = len(result.primary_thought.content.split())
+        word_count = result.primary_thought.word_count
         
         # High confidence agent: Alex has confidence=7
         # Should have relatively low hedging ratio
@@ -183,18 +190,19 @@ class TestPersonalityInfluencesStyle:
         """Compare confidence styles between senior and junior."""
         stimulus = "Should we refactor this module?"
         
-        alex_result = await processor_for_alex.process(
-            stimulus=stimulus,
-            urgency=0.3,
-            complexity=0.5,
-            relevance=0.8,
-        )
-        
-        emily_result = await processor_for_emily.process(
-            stimulus=stimulus,
-            urgency=0.3,
-            complexity=0.5,
-            relevance=0.6,
+        alex_result, emily_result = await asyncio.gather(
+            processor_for_alex.process(
+                stimulus=stimulus,
+                urgency=0.3,
+                complexity=0.5,
+                relevance=0.8,
+            ),
+            processor_for_emily.process(
+                stimulus=stimulus,
+                urgency=0.3,
+                complexity=0.5,
+                relevance=0.6,
+            ),
         )
         
         comparison = compare_responses(alex_result, emily_result)
@@ -245,9 +253,14 @@ class TestCommunicationStylePreserved:
         assert result.primary_thought is not None
         
         # Check that it's not overly formal (no rigid structure markers)
+        # Only the threshold matters, so stop counting once it is reached
         content = result.primary_thought.content
-        formal_markers = ["Therefore,", "Furthermore,", "In conclusion,", "To summarize,"]
-        formal_count = sum(1 for marker in formal_markers if marker in content)
+        formal_count = 0
+        for marker in FORMAL_MARKERS:
+            if marker in content:
+                formal_count += 1
+                if formal_count >= 3:
+                    break
         
         # Casual style shouldn't have many formal markers
         # (This is a weak check since mocks may vary)
@@ -280,20 +293,21 @@ class TestExpertiseGapsRespected:
     @pytest.mark.asyncio
     async def test_domain_expertise_vs_gap_confidence(self, processor_for_alex):
         """Compare confidence in expertise area vs knowledge gap."""
-        # Expertise area (databases)
-        db_result = await processor_for_alex.process(
-            stimulus="How should we optimize our PostgreSQL queries?",
-            urgency=0.3,
-            complexity=0.6,
-            relevance=0.9,
-        )
-        
-        # Knowledge gap (ML)
-        ml_result = await processor_for_alex.process(
-            stimulus="How should we tune our neural network hyperparameters?",
-            urgency=0.3,
-            complexity=0.6,
-            relevance=0.3,  # Lower since it's a gap
+        db_result, ml_result = await asyncio.gather(
+            # Expertise area (databases)
+            processor_for_alex.process(
+                stimulus="How should we optimize our PostgreSQL queries?",
+                urgency=0.3,
+                complexity=0.6,
+                relevance=0.9,
+            ),
+            # Knowledge gap (ML)
+            processor_for_alex.process(
+                stimulus="How should we tune our neural network hyperparameters?",
+                urgency=0.3,
+                complexity=0.6,
+                relevance=0.3,  # Lower since it's a gap
+            ),
         )
         
         # Should have higher confidence in expertise area
@@ -308,12 +322,10 @@ class TestRoleInfluencesBehavior:
     """Tests that agent role affects behavior patterns."""
 
     @pytest.mark.asyncio
-    async def test_tech_lead_facilitative(self, alex_chen, david_kim):
+    async def test_tech_lead_facilitative(self, alex_chen, processor_for_david):
         """Tech Lead should have facilitative tendencies."""
         # David Kim has facilitation_instinct=9
-        processor_david = create_processor_with_mock_router(david_kim)
-        
-        result = await processor_david.process(
+        result = await processor_for_david.process(
             stimulus="The team can't agree on the approach. What should we do?",
             urgency=0.5,
             complexity=0.5,
@@ -360,15 +372,16 @@ class TestIdentityConsistency:
             "How do we handle authentication?",
         ]
         
-        confidences = []
-        for question in questions:
-            result = await processor_for_alex.process(
+        results = await asyncio.gather(*(
+            processor_for_alex.process(
                 stimulus=question,
                 urgency=0.3,
                 complexity=0.6,
                 relevance=0.9,
             )
-            confidences.append(result.primary_thought.confidence)
+            for question in questions
+        ))
+        confidences = [result.primary_thought.confidence for result in results]
         
         # All should be high confidence (Alex's domain)
         avg_confidence = sum(confidences) / len(confidences)
@@ -389,14 +402,16 @@ class TestIdentityConsistency:
         """Different agents should have different confidence baselines."""
         stimulus = "What do you think about this project?"
         
-        alex_result = await processor_for_alex.process(
-            stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
-        )
-        maya_result = await processor_for_maya.process(
-            stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
-        )
-        emily_result = await processor_for_emily.process(
-            stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
+        alex_result, maya_result, emily_result = await asyncio.gather(
+            processor_for_alex.process(
+                stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
+            ),
+            processor_for_maya.process(
+                stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
+            ),
+            processor_for_emily.process(
+                stimulus=stimulus, urgency=0.3, complexity=0.5, relevance=0.7
+            ),
         )
         
         # All should produce responses
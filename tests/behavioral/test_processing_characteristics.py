@@ -9,16 +9,11 @@ Tests that verify processing characteristics meet requirements:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
+import heapq
+import math
 import time
-from datetime import datetime
-from typing import List, Dict
-from unittest.mock import AsyncMock, MagicMock
-from statistics import mean, stdev
-
-from conftest import (
-    analyze_response_style,
-)
 
 
 # =============================================================================
@@ -47,28 +42,44 @@ TOKEN_LIMITS = {
 # LATENCY TESTS
 # =============================================================================
 
+
+async def _timed_ms(coro) -> float:
+    """Await a coroutine and return how long it took in milliseconds."""
+    start = time.perf_counter()
+    await coro
+    return (time.perf_counter() - start) * 1000
+
+
+def _p95(values) -> float:
+    """Nearest-rank 95th percentile, without sorting the whole sample."""
+    k = len(values) - math.ceil(0.95 * len(values)) + 1
+    return heapq.nlargest(k, values)[-1]
+
+
 class TestLatencyTargets:
-    """Tests that processing meets latency targets."""
+    """Tests that processing meets latency targets.
+    
+    Deselected by default: against the mock router these only time Python
+    overhead. Run them with ``pytest -m requires_real_llm``.
+    """
+
+    pytestmark = pytest.mark.requires_real_llm
 
     @pytest.mark.asyncio
     async def test_reflex_latency(self, processor_for_alex):
         """REFLEX processing should complete within target latency."""
-        latencies = []
-        
         # Run multiple times for statistical significance
-        for _ in range(5):
-            start = time.time()
-            result = await processor_for_alex.process(
+        latencies = [
+            await _timed_ms(processor_for_alex.process(
                 stimulus="Alert!",
                 urgency=1.0,
                 complexity=0.1,
                 relevance=0.9,
-            )
-            elapsed_ms = (time.time() - start) * 1000
-            latencies.append(elapsed_ms)
+            ))
+            for _ in range(5)
+        ]
         
-        # Calculate p95 (with small sample, use max)
-        p95 = max(latencies)
+        p95 = _p95(latencies)
         target = LATENCY_TARGETS_MS["REFLEX"]
         
         assert p95 <= target, (
@@ -78,20 +89,17 @@ class TestLatencyTargets:
     @pytest.mark.asyncio
     async def test_reactive_latency(self, processor_for_alex):
         """REACTIVE processing should complete within target latency."""
-        latencies = []
-        
-        for _ in range(5):
-            start = time.time()
-            result = await processor_for_alex.process(
+        latencies = [
+            await _timed_ms(processor_for_alex.process(
                 stimulus="There's a performance issue we should look at",
                 urgency=0.6,
                 complexity=0.4,
                 relevance=0.9,
-            )
-            elapsed_ms = (time.time() - start) * 1000
-            latencies.append(elapsed_ms)
+            ))
+            for _ in range(5)
+        ]
         
-        p95 = max(latencies)
+        p95 = _p95(latencies)
         target = LATENCY_TARGETS_MS["REACTIVE"]
         
         assert p95 <= target, (
@@ -101,20 +109,17 @@ class TestLatencyTargets:
     @pytest.mark.asyncio
     async def test_deliberate_latency(self, processor_for_alex):
         """DELIBERATE processing should complete within target latency."""
-        latencies = []
-        
-        for _ in range(3):  # Fewer iterations for slower tier
-            start = time.time()
-            result = await processor_for_alex.process(
+        latencies = [
+            await _timed_ms(processor_for_alex.process(
                 stimulus="How should we design the authentication system?",
                 urgency=0.2,
                 complexity=0.8,
                 relevance=0.9,
-            )
-            elapsed_ms = (time.time() - start) * 1000
-            latencies.append(elapsed_ms)
+            ))
+            for _ in range(3)  # Fewer iterations for slower tier
+        ]
         
-        p95 = max(latencies)
+        p95 = _p95(latencies)
         target = LATENCY_TARGETS_MS["DELIBERATE"]
         
         assert p95 <= target, (
@@ -125,17 +130,17 @@ class TestLatencyTargets:
     async def test_latency_proportional_to_complexity(self, processor_for_alex):
         """Higher complexity should generally take more time."""
         # Simple scenario
-        start_simple = time.time()
+        start_simple = time.perf_counter()
         await processor_for_alex.process(
             stimulus="OK",
             urgency=0.9,
             complexity=0.1,
             relevance=0.9,
         )
-        simple_time = time.time() - start_simple
+        simple_time = time.perf_counter() - start_simple
         
         # Complex scenario
-        start_complex = time.time()
+        start_complex = time.perf_counter()
         await processor_for_alex.process(
             stimulus="Design the complete data architecture including "
                      "sharding strategy, replication, and failover",
@@ -143,7 +148,7 @@ class TestLatencyTargets:
             complexity=0.9,
             relevance=0.9,
         )
-        complex_time = time.time() - start_complex
+        complex_time = time.perf_counter() - start_complex
         
         # Complex should not be significantly faster than simple
         # (with mocks, times may be similar, but complex shouldn't be faster)
@@ -174,7 +179,7 @@ class TestTokenLimits:
         
         for thought in reflex_thoughts:
             # Rough estimate: 1 token ≈ 0.75 words
-            word_count = len(thought.content.split())
+            word_count = thought.word_count
             estimated_tokens = word_count / 0.75
             limit = TOKEN_LIMITS["REFLEX"]
             
@@ -195,7 +200,7 @@ class TestTokenLimits:
         deliberate_thoughts = [t for t in result.thoughts if t.tier.name == "DELIBERATE"]
         
         for thought in deliberate_thoughts:
-            word_count = len(thought.content.split())
+            word_count = thought.word_count
             estimated_tokens = word_count / 0.75
             limit = TOKEN_LIMITS["DELIBERATE"]
             
@@ -223,8 +228,8 @@ class TestTokenLimits:
         )
         
         # Get word counts
-        reflex_words = sum(len(t.content.split()) for t in reflex_result.thoughts)
-        deliberate_words = sum(len(t.content.split()) for t in deliberate_result.thoughts)
+        reflex_words = sum(t.word_count for t in reflex_result.thoughts)
+        deliberate_words = sum(t.word_count for t in deliberate_result.thoughts)
         
         # DELIBERATE should use more tokens than REFLEX
         # (with mocks may be similar, but DELIBERATE shouldn't be less)
@@ -238,18 +243,43 @@ class TestTokenLimits:
 # THOUGHT TYPE DISTRIBUTION TESTS
 # =============================================================================
 
+# Stimuli for the distribution tests: (stimulus, urgency, complexity, relevance)
+DISTRIBUTION_STIMULI = {
+    "urgent_emergency": ("Emergency! Server down!", 1.0, 0.1, 0.9),
+    "architecture_patterns": (
+        "What patterns do you see in our architecture decisions?", 0.1, 0.9, 0.9,
+    ),
+    "security_concern": (
+        "I'm worried about the security implications of this approach", 0.4, 0.6, 0.9,
+    ),
+    "how_question": ("How does this work?", 0.3, 0.5, 0.8),
+}
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def alex_distribution_results(processor_for_alex):
+    """Process every distribution stimulus once, concurrently, for the class."""
+    results = await asyncio.gather(*(
+        processor_for_alex.process(
+            stimulus=stimulus,
+            urgency=urgency,
+            complexity=complexity,
+            relevance=relevance,
+        )
+        for stimulus, urgency, complexity, relevance in DISTRIBUTION_STIMULI.values()
+    ))
+    return dict(zip(DISTRIBUTION_STIMULI, results))
+
+
 class TestThoughtTypeDistribution:
-    """Tests that thought types are distributed appropriately."""
+    """Tests that thought types are distributed appropriately.
 
-    @pytest.mark.asyncio
-    async def test_urgent_scenario_produces_reactions(self, processor_for_alex):
+    The tests only inspect output, so they share one result per stimulus.
+    """
+
+    def test_urgent_scenario_produces_reactions(self, alex_distribution_results):
         """Urgent scenarios should produce reaction-type thoughts."""
-        result = await processor_for_alex.process(
-            stimulus="Emergency! Server down!",
-            urgency=1.0,
-            complexity=0.1,
-            relevance=0.9,
-        )
+        result = alex_distribution_results["urgent_emergency"]
         
         thought_types = [t.thought_type for t in result.thoughts]
         
@@ -261,15 +291,9 @@ class TestThoughtTypeDistribution:
         # (though may also have other types from parallel processing)
         assert len(thought_types) > 0
 
-    @pytest.mark.asyncio
-    async def test_analytical_scenario_produces_insights(self, processor_for_alex):
+    def test_analytical_scenario_produces_insights(self, alex_distribution_results):
         """Analytical scenarios should produce insight-type thoughts."""
-        result = await processor_for_alex.process(
-            stimulus="What patterns do you see in our architecture decisions?",
-            urgency=0.1,
-            complexity=0.9,
-            relevance=0.9,
-        )
+        result = alex_distribution_results["architecture_patterns"]
         
         thought_types = [t.thought_type for t in result.thoughts]
         
@@ -281,15 +305,9 @@ class TestThoughtTypeDistribution:
         if result.primary_thought:
             assert result.primary_thought.thought_type in ["insight", "plan", "concern", "question"]
 
-    @pytest.mark.asyncio
-    async def test_concern_triggers_concern_thoughts(self, processor_for_alex):
+    def test_concern_triggers_concern_thoughts(self, alex_distribution_results):
         """Risk-related stimuli should trigger concern-type thoughts."""
-        result = await processor_for_alex.process(
-            stimulus="I'm worried about the security implications of this approach",
-            urgency=0.4,
-            complexity=0.6,
-            relevance=0.9,
-        )
+        result = alex_distribution_results["security_concern"]
         
         thought_types = [t.thought_type for t in result.thoughts]
         
@@ -297,15 +315,9 @@ class TestThoughtTypeDistribution:
         # (depending on how the agent processes it)
         assert len(thought_types) > 0
 
-    @pytest.mark.asyncio
-    async def test_question_can_trigger_question_thoughts(self, processor_for_alex):
+    def test_question_can_trigger_question_thoughts(self, alex_distribution_results):
         """Questions might trigger question-type thoughts (seeking clarification)."""
-        result = await processor_for_alex.process(
-            stimulus="How does this work?",
-            urgency=0.3,
-            complexity=0.5,
-            relevance=0.8,
-        )
+        result = alex_distribution_results["how_question"]
         
         # Should produce some response
         assert len(result.thoughts) > 0
@@ -326,14 +338,14 @@ class TestProcessingTime:
     @pytest.mark.asyncio
     async def test_total_processing_time_reasonable(self, processor_for_alex):
         """Total processing time should be reasonable for given scenario."""
-        start = time.time()
+        start = time.perf_counter()
         result = await processor_for_alex.process(
             stimulus="Handle this situation",
             urgency=0.5,
             complexity=0.5,
             relevance=0.9,
         )
-        total_time = time.time() - start
+        total_time = time.perf_counter() - start
         
         # Processing time should be captured
         assert result.processing_time_ms > 0
@@ -344,14 +356,14 @@ class TestProcessingTime:
     @pytest.mark.asyncio
     async def test_processing_time_matches_result(self, processor_for_alex):
         """Result's processing_time_ms should match actual time."""
-        start = time.time()
+        start = time.perf_counter()
         result = await processor_for_alex.process(
             stimulus="Process this",
             urgency=0.5,
             complexity=0.5,
             relevance=0.9,
         )
-        actual_time_ms = (time.time() - start) * 1000
+        actual_time_ms = (time.perf_counter() - start) * 1000
         
         # Result's reported time should be close to actual
         # (may be slightly less due to result building overhead)
@@ -506,14 +518,14 @@ class TestPerformanceRegression:
     @pytest.mark.asyncio
     async def test_simple_stimulus_fast(self, processor_for_alex):
         """Simple stimuli should process quickly."""
-        start = time.time()
+        start = time.perf_counter()
         result = await processor_for_alex.process(
             stimulus="OK",
             urgency=0.5,
             complexity=0.1,
             relevance=0.5,
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Simple stimulus should be fast
         assert elapsed < 2.0, f"Simple stimulus took {elapsed:.2f}s"
@@ -521,7 +533,7 @@ class TestPerformanceRegression:
     @pytest.mark.asyncio
     async def test_complex_stimulus_within_bounds(self, processor_for_alex):
         """Complex stimuli should process within bounds."""
-        start = time.time()
+        start = time.perf_counter()
         result = await processor_for_alex.process(
             stimulus="Design a complete microservices architecture "
                      "including service mesh, observability stack, "
@@ -530,7 +542,7 @@ class TestPerformanceRegression:
             complexity=1.0,
             relevance=0.9,
         )
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Complex but should still complete within bounds
         assert elapsed < 15.0, f"Complex stimulus took {elapsed:.2f}s"
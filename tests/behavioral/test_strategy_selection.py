@@ -103,7 +103,7 @@ class TestHighUrgencyStrategy:
         first_thought = result.thoughts[0]
         
         # Should be brief (REFLEX tier)
-        word_count = len(first_thought.content.split())
+        word_count = first_thought.word_count
         assert word_count < 60, (
             f"First thought should be brief, got {word_count} words"
         )
@@ -238,7 +238,7 @@ class TestLowRelevanceStrategy:
         )
         
         # Thought should be brief
-        word_count = len(result.primary_thought.content.split())
+        word_count = result.primary_thought.word_count
         assert word_count < 50, (
             f"Low relevance response should be brief, got {word_count} words"
         )
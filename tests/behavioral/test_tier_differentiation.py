@@ -18,7 +18,7 @@ from datetime import datetime
 from typing import List, Dict
 from unittest.mock import AsyncMock, MagicMock
 
-from conftest import (
+from tests.behavioral.conftest import (
     analyze_response_style,
     score_response_quality,
 )
@@ -77,17 +77,12 @@ TIER_CHARACTERISTICS = {
 }
 
 
-def count_words(text: str) -> int:
-    """Count words in text."""
-    return len(text.split())
-
-
 def check_tier_characteristics(thought, tier_name: str) -> Dict[str, bool]:
     """Check if thought matches tier characteristics."""
     chars = TIER_CHARACTERISTICS[tier_name]
     results = {}
     
-    word_count = count_words(thought.content)
+    word_count = thought.word_count
     
     # Word count checks
     if "min_words" in chars:
@@ -141,7 +136,7 @@ class TestReflexTier:
         
         # Check REFLEX characteristics
         for thought in reflex_thoughts:
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             assert word_count <= TIER_CHARACTERISTICS["REFLEX"]["max_words"], (
                 f"REFLEX thought too long: {word_count} words"
             )
@@ -224,7 +219,7 @@ class TestReactiveTier:
         reactive_thoughts = [t for t in result.thoughts if t.tier.name == "REACTIVE"]
         
         for thought in reactive_thoughts:
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             chars = TIER_CHARACTERISTICS["REACTIVE"]
             
             assert word_count >= chars["min_words"], (
@@ -295,7 +290,7 @@ class TestDeliberateTier:
         deliberate_thoughts = [t for t in result.thoughts if t.tier.name == "DELIBERATE"]
         
         for thought in deliberate_thoughts:
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             chars = TIER_CHARACTERISTICS["DELIBERATE"]
             
             assert word_count >= chars["min_words"], (
@@ -385,7 +380,7 @@ class TestAnalyticalTier:
         analytical_thoughts = [t for t in result.thoughts if t.tier.name == "ANALYTICAL"]
         
         for thought in analytical_thoughts:
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             chars = TIER_CHARACTERISTICS["ANALYTICAL"]
             
             assert word_count >= chars["min_words"], (
@@ -479,8 +474,8 @@ class TestTierProgression:
             relevance=0.9,
         )
         
-        urgent_words = count_words(urgent_result.primary_thought.content)
-        complex_words = count_words(complex_result.primary_thought.content)
+        urgent_words = urgent_result.primary_thought.word_count
+        complex_words = complex_result.primary_thought.word_count
         
         # Complex should be substantially longer (unless mocks are identical)
         # At minimum, complex shouldn't be shorter
@@ -560,7 +555,7 @@ class TestTierOutputQuality:
         
         for thought in reflex_thoughts:
             # Should be simple acknowledgment, not detailed analysis
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             assert word_count < 100, f"REFLEX too complex: {word_count} words"
 
     @pytest.mark.asyncio
@@ -577,7 +572,7 @@ class TestTierOutputQuality:
         
         for thought in deliberate_thoughts:
             # DELIBERATE should have substance
-            word_count = count_words(thought.content)
+            word_count = thought.word_count
             assert word_count >= 30, (
                 f"DELIBERATE should have substantial reasoning: {word_count} words"
             )
@@ -245,6 +245,48 @@ class TestThoughtModel:
         assert thought.externalized is False
         assert thought.still_relevant is True
 
+    def test_word_count(self):
+        """Test that word_count follows the current content."""
+        thought = Thought(
+            tier=CognitiveTier.REACTIVE,
+            content="  This is  an interesting\nobservation. ",
+            thought_type=ThoughtType.OBSERVATION,
+            trigger="test",
+        )
+        assert thought.word_count == 5
+
+        thought.content = "Changed my mind"
+        assert thought.word_count == 3
+
+        copy = thought.model_copy(update={"content": "Quick reaction"})
+        assert copy.word_count == 2
+
+    def test_word_count_does_not_affect_equality(self):
+        """Test that reading word_count leaves equality unchanged."""
+        thought = Thought(
+            tier=CognitiveTier.REFLEX,
+            content="Quick reaction",
+            thought_type=ThoughtType.REACTION,
+            trigger="test",
+        )
+        copy = thought.model_copy()
+
+        assert thought.word_count == 2
+        assert thought == copy
+
+    def test_content_lower(self):
+        """Test that content_lower follows the current content."""
+        thought = Thought(
+            tier=CognitiveTier.DELIBERATE,
+            content="Use PostgreSQL Replicas",
+            thought_type=ThoughtType.PLAN,
+            trigger="test",
+        )
+        assert thought.content_lower == "use postgresql replicas"
+
+        thought.content = "Add REDIS"
+        assert thought.content_lower == "add redis"
+
     def test_thought_id_generated(self):
         """Test that thought_id is automatically generated."""
         thought = Thought(
@@ -404,6 +446,12 @@ class TestCognitiveResult:
         )
         assert result.highest_tier_used == CognitiveTier.DELIBERATE
 
+    def test_cognitive_result_tiers_mask(self):
+        """Test tiers_mask property."""
+        result = CognitiveResult(tiers_used=[CognitiveTier.REFLEX, CognitiveTier.DELIBERATE])
+        assert result.tiers_mask == 0b101
+        assert CognitiveResult().tiers_mask == 0
+
     def test_cognitive_result_to_dict(self):
         """Test CognitiveResult to_dict method."""
         result = CognitiveResult(
@@ -636,6 +684,23 @@ class TestCognitiveProcessor:
         assert result.primary_thought is not None
         assert result.processing_time_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_process_blank_stimulus_skips_models(self, sample_agent_profile):
+        """Test that a blank stimulus returns no thoughts without model calls."""
+        processor = create_processor_with_mock_router(sample_agent_profile)
+        result = await processor.process(
+            stimulus="  \n\t ",
+            urgency=0.9,
+            complexity=0.9,
+            relevance=0.9,
+        )
+        assert result.thoughts == []
+        assert result.primary_thought is None
+        assert result.agent_id == sample_agent_profile.agent_id
+        assert all(
+            client.get_call_count() == 0 for client in processor.router.clients.values()
+        )
+
     @pytest.mark.asyncio
     async def test_process_with_tier_override(self, sample_agent_profile):
         """Test processing with specific tier."""
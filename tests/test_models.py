@@ -147,6 +147,23 @@ class TestMockModelClient:
 
         assert mock_client.get_total_tokens() > 0
 
+    @pytest.mark.asyncio
+    async def test_response_cache_reuses_repeated_prompt(self, mock_client):
+        """Repeated prompts should reuse the response when caching is on."""
+        mock_client.mock_config.cache_responses = True
+        request = InferenceRequest(prompt="Test prompt")
+
+        first = await mock_client.generate(request)
+        second = await mock_client.generate(request)
+
+        assert second.text == first.text
+        assert second.latency_ms == 0.0
+        assert mock_client.get_call_count() == 2
+
+        mock_client.clear_response_cache()
+        third = await mock_client.generate(request)
+        assert third.latency_ms > 0
+
     @pytest.mark.asyncio
     async def test_failure_injection(self, mock_client):
         """Should fail when failure_rate is 1.0."""
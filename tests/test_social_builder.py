@@ -56,9 +56,9 @@ class TestFromMeetingState:
         assert context.group_type == GroupType.PAIR
         assert context.current_speaker == "agent-1"
         assert context.topic_under_discussion == "architecture"
-        assert context.discussion_phase == "exploring"
+        assert context.discussion_phase is DiscussionPhase.EXPLORING
         assert len(context.participants) == 2
-        assert context.energy_level == "engaged"
+        assert context.energy_level is EnergyLevel.ENGAGED
     
     def test_expertise_map_building(self):
         """Test that expertise map is built correctly."""
@@ -125,7 +125,7 @@ class TestFromMeetingState:
         # Should create valid context with defaults
         assert context.group_size == 1
         assert context.participants == []
-        assert context.discussion_phase == DiscussionPhase.EXPLORING.value
+        assert context.discussion_phase is DiscussionPhase.EXPLORING
 
 
 class TestFromConversation:
@@ -270,7 +270,7 @@ class TestMeetingContext:
             participants=participants,
             my_role="facilitator",
             topic="sprint planning",
-            phase=DiscussionPhase.EXPLORING.value,
+            phase=DiscussionPhase.EXPLORING,
         )
         
         assert context.group_size == 4  # 3 participants + me
@@ -3,6 +3,8 @@
 Tests for SocialContext, ParticipantInfo, and GroupType from Phase 5.
 """
 
+import sys
+
 import pytest
 
 from src.social.context import (
@@ -103,12 +105,12 @@ class TestSocialContext:
         assert context.my_status_relative == "peer"
         assert context.current_speaker is None
         assert context.topic_under_discussion == ""
-        assert context.discussion_phase == DiscussionPhase.EXPLORING.value
+        assert context.discussion_phase is DiscussionPhase.EXPLORING
         assert context.expertise_present == {}
         assert context.expertise_gaps == []
         assert context.speaking_distribution == {}
-        assert context.energy_level == EnergyLevel.ENGAGED.value
-        assert context.consensus_level == ConsensusLevel.DISCUSSING.value
+        assert context.energy_level is EnergyLevel.ENGAGED
+        assert context.consensus_level is ConsensusLevel.DISCUSSING
     
     def test_group_type_solo(self):
         """Test group type classification for solo."""
@@ -177,6 +179,44 @@ class TestSocialContext:
         assert participant.has_spoken is True
         assert participant.contribution_count == 1
     
+    def test_unspoken_participants_tracks_update_speaker(self):
+        """Test that the unspoken iterator drops participants as they speak."""
+        alice = ParticipantInfo(agent_id="agent-1", name="Alice")
+        bob = ParticipantInfo(agent_id="agent-2", name="Bob", has_spoken=True)
+        carol = ParticipantInfo(agent_id="agent-3", name="Carol")
+        context = SocialContext(participants=[alice, bob, carol], group_size=4)
+        
+        assert list(context.unspoken_participants()) == [alice, carol]
+        
+        context.update_speaker("agent-3")
+        
+        assert list(context.unspoken_participants()) == [alice]
+    
+    def test_refresh_participant_index_after_direct_mutation(self):
+        """Test resyncing participant lookups after editing the list directly."""
+        context = SocialContext(participants=[ParticipantInfo(agent_id="agent-1", name="Alice")])
+        dave = ParticipantInfo(agent_id="agent-4", name="Dave")
+        context.participants.insert(0, dave)
+        
+        # Lookups still find participants before a refresh
+        assert context.get_participant("agent-1").name == "Alice"
+        
+        context.refresh_participant_index()
+        
+        assert [p.name for p in context.unspoken_participants()] == ["Dave", "Alice"]
+    
+    def test_role_and_speaker_strings_interned(self):
+        """Test that role/status/speaker strings are interned."""
+        context = SocialContext(
+            my_role="".join(["ex", "pert"]),
+            my_status_relative="".join(["se", "nior"]),
+        )
+        context.update_speaker("".join(["agent", "-1"]))
+        
+        assert context.my_role is sys.intern("expert")
+        assert context.my_status_relative is sys.intern("senior")
+        assert context.current_speaker is sys.intern("agent-1")
+    
     def test_update_speaker_multiple_times(self):
         """Test updating speaker multiple times."""
         participant = ParticipantInfo(agent_id="agent-1", name="Alice")
@@ -207,6 +247,24 @@ class TestSocialContext:
         
         assert total == 0
     
+    def test_total_contributions_tracks_update_speaker(self):
+        """Test that the running total follows update_speaker calls."""
+        context = SocialContext(speaking_distribution={"agent-1": 2})
+        
+        context.update_speaker("agent-1")
+        context.update_speaker("agent-2")
+        
+        assert context.get_total_contributions() == 4
+    
+    def test_recompute_totals_after_direct_mutation(self):
+        """Test resyncing the total after editing the distribution directly."""
+        context = SocialContext(speaking_distribution={"agent-1": 2})
+        context.speaking_distribution["agent-2"] = 5
+        
+        context.recompute_totals()
+        
+        assert context.get_total_contributions() == 7
+    
     def test_get_contribution_share(self):
         """Test calculating contribution share."""
         context = SocialContext(
@@ -260,6 +318,103 @@ class TestSocialContext:
         
         assert len(learning_experts) > 0
     
+    def test_large_expertise_map_matches_linear_scan(self):
+        """Test that the indexed lookup for large maps matches a linear scan."""
+        expertise_present = {
+            f"skill_{i}": [f"agent-{i}"] for i in range(20)
+        }
+        expertise_present.update({
+            "Machine Learning": ["agent-ml"],
+            "deep learning": ["agent-dl"],
+            "learning": ["agent-l"],
+            "system_design": ["agent-sd"],
+            "api": ["agent-api"],
+        })
+        context = SocialContext(expertise_present=expertise_present)
+        
+        def linear_scan(skill):
+            skill_lower = skill.lower()
+            for expertise, agent_ids in expertise_present.items():
+                if skill_lower in expertise.lower() or expertise.lower() in skill_lower:
+                    return agent_ids
+            return []
+        
+        for skill in [
+            "learning", "LEARNING", "machine", "ml", "design", "system_design_review",
+            "rest_apis", "api", "skill_1", "skill_15", "skill_150", "rust", "",
+        ]:
+            assert context.get_participants_with_expertise(skill) == linear_scan(skill), skill
+    
+    def test_large_expertise_index_rebuilt_on_key_change(self):
+        """Test that adding skills to a large map is reflected in lookups."""
+        context = SocialContext(
+            expertise_present={f"skill_{i}": [f"agent-{i}"] for i in range(20)}
+        )
+        assert context.get_participants_with_expertise("rust") == []
+        
+        context.expertise_present["rust"] = ["agent-rust"]
+        
+        assert context.get_participants_with_expertise("rust") == ["agent-rust"]
+    
+    def test_large_expertise_index_rebuilt_on_same_size_swap(self):
+        """Test that deleting and adding a skill directly, keeping the size, is picked up."""
+        context = SocialContext(
+            expertise_present={f"skill_{i}": [f"agent-{i}"] for i in range(20)}
+        )
+        assert context.get_participants_with_expertise("skill_3") == ["agent-3"]
+        
+        del context.expertise_present["skill_3"]
+        context.expertise_present["rust"] = ["agent-rust"]
+        
+        assert context.get_participants_with_expertise("skill_3") == []
+        assert context.get_participants_with_expertise("rust") == ["agent-rust"]
+    
+    def test_set_expertise_invalidates_large_index(self):
+        """Test that set_expertise is reflected even when the key count is unchanged."""
+        context = SocialContext(
+            expertise_present={f"skill_{i}": [f"agent-{i}"] for i in range(20)}
+        )
+        assert context.get_participants_with_expertise("skill_3") == ["agent-3"]
+        
+        context.set_expertise("skill_3", ["agent-new"])
+        
+        assert context.get_participants_with_expertise("skill_3") == ["agent-new"]
+    
+    def test_add_participant_updates_indexes(self):
+        """Test that add_participant registers expertise and unspoken state."""
+        context = SocialContext(group_size=3)
+        bob = ParticipantInfo(agent_id="agent-2", name="Bob", expertise_areas=["Python"])
+        
+        context.add_participant(bob)
+        
+        assert context.get_participant("agent-2") is bob
+        assert list(context.unspoken_participants()) == [bob]
+        assert context.get_participants_with_expertise("python") == ["agent-2"]
+    
+    def test_dominant_expert_for_single_expert(self):
+        """Test finding the sole expert on a topic."""
+        context = SocialContext(
+            expertise_present={
+                "python": ["agent-1"],
+                "javascript": ["agent-2"],
+            }
+        )
+        
+        assert context.dominant_expert_for("python performance") == "agent-1"
+    
+    def test_dominant_expert_for_none_when_shared_or_absent(self):
+        """Test that shared or missing expertise has no dominant expert."""
+        context = SocialContext(
+            expertise_present={
+                "python": ["agent-1", "agent-2"],
+                "javascript": ["agent-3"],
+            }
+        )
+        
+        assert context.dominant_expert_for("python") is None
+        assert context.dominant_expert_for("javascript python") is None
+        assert context.dominant_expert_for("rust") is None
+    
     def test_has_expert_for_topic(self):
         """Test checking for topic experts."""
         context = SocialContext(
@@ -288,7 +443,21 @@ class TestSocialContext:
         assert d["group_type"] == "pair"
         assert d["my_role"] == "expert"
         assert d["topic_under_discussion"] == "architecture"
+        assert d["discussion_phase"] == "exploring"
+        assert d["energy_level"] == "engaged"
         assert len(d["participants"]) == 1
+    
+    def test_string_states_coerced_to_enums(self):
+        """Test that string phase/energy/consensus values become enum members."""
+        context = SocialContext(
+            discussion_phase="closing",
+            energy_level="heated",
+            consensus_level="divided",
+        )
+        
+        assert context.discussion_phase is DiscussionPhase.CLOSING
+        assert context.energy_level is EnergyLevel.HEATED
+        assert context.consensus_level is ConsensusLevel.DIVIDED
 
 
 class TestEnums:
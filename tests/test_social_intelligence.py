@@ -212,6 +212,55 @@ class TestDeferToExpert:
         
         # Should be willing to contribute now
         assert decision.intent != ExternalizationIntent.PASSIVE_AWARENESS
+    
+    def test_defer_again_after_spoken_flag_reset(self, social_intelligence):
+        """Test that resetting has_spoken directly makes the expert a candidate again."""
+        expert = ParticipantInfo(
+            agent_id="expert-1",
+            name="Bob",
+            role="Principal Engineer",
+            expertise_areas=["python", "system_design", "architecture"],
+        )
+        stimulus = Stimulus(
+            content="What's the best approach for scaling?",
+            topic="system design scaling",
+        )
+        context = SocialContext(
+            participants=[expert],
+            group_size=3,
+            expertise_present={"system_design": ["expert-1"], "scaling": ["expert-1"]},
+        )
+        context.update_speaker("expert-1")
+        assert social_intelligence.should_i_speak(stimulus, context).factors["defer_to"] is None
+        
+        # New round: flags are reset directly on the participant
+        expert.has_spoken = False
+        
+        decision = social_intelligence.should_i_speak(stimulus, context)
+        
+        assert decision.intent == ExternalizationIntent.ACTIVE_LISTEN
+        assert decision.factors["defer_to"] == "Bob"
+    
+    def test_sole_expert_skips_deference_check(
+        self, social_intelligence, sample_agent, monkeypatch
+    ):
+        """Test that the deference scan is skipped when I'm the only expert."""
+        def fail_defer(*args, **kwargs):
+            raise AssertionError("_should_defer_to_expert should not be called")
+        
+        monkeypatch.setattr(social_intelligence, "_should_defer_to_expert", fail_defer)
+        
+        stimulus = Stimulus(content="How should we test this?", topic="python testing")
+        context = SocialContext(
+            participants=[ParticipantInfo(agent_id="other-1", name="Bob")],
+            group_size=2,
+            expertise_present={"python": [str(sample_agent.agent_id)]},
+        )
+        
+        decision = social_intelligence.should_i_speak(stimulus, context)
+        
+        assert decision.factors["should_defer"] is False
+        assert decision.factors["defer_to"] is None
 
 
 class TestConversationalSpace:
@@ -235,7 +284,7 @@ class TestConversationalSpace:
         stimulus = Stimulus(content="Final thoughts?", topic="python")
         context = SocialContext(
             group_size=5,
-            discussion_phase=DiscussionPhase.CLOSING.value,
+            discussion_phase=DiscussionPhase.CLOSING,
         )
         
         decision = social_intelligence.should_i_speak(stimulus, context)
@@ -248,7 +297,7 @@ class TestConversationalSpace:
         stimulus = Stimulus(content="This is wrong!", topic="python")
         context = SocialContext(
             group_size=5,
-            energy_level=EnergyLevel.HEATED.value,
+            energy_level=EnergyLevel.HEATED,
         )
         
         decision = social_intelligence.should_i_speak(stimulus, context)
@@ -421,6 +470,18 @@ class TestExpertiseCalculation:
         marketing_relevance = social_intelligence._calculate_expertise_match("marketing strategy")
         assert marketing_relevance < 0.3  # Should be low
     
+    def test_no_skill_overlap_returns_zero(self, social_intelligence):
+        """Test that topics sharing nothing with the agent's skills score 0.0."""
+        assert social_intelligence._has_skill_overlap(["marketing", "strategy"]) is False
+        assert social_intelligence._calculate_expertise_match("marketing strategy") == 0.0
+    
+    def test_skill_overlap_uses_substring_rule(self, social_intelligence):
+        """Test that partial keyword/skill matches still count as overlap."""
+        # "system-design" normalizes to a skill; "databases" contains "database"
+        assert social_intelligence._has_skill_overlap(["system-design"]) is True
+        assert social_intelligence._has_skill_overlap(["database"]) is True
+        assert social_intelligence._has_skill_overlap(["pythonic"]) is True
+    
     def test_empty_topic_medium_relevance(self, social_intelligence):
         """Test that empty topic gives medium relevance."""
         relevance = social_intelligence._calculate_expertise_match("")
@@ -440,6 +501,36 @@ class TestConvenienceMethods:
         assert decision is not None
         assert decision.intent is not None
     
+    def test_evaluate_batch_matches_individual_decisions(
+        self, social_intelligence, sample_agent, sample_mind
+    ):
+        """Test that batch evaluation agrees with per-agent should_i_speak."""
+        observer_agent = sample_agent.model_copy(
+            update={
+                "agent_id": uuid4(),
+                "name": "Carol",
+                "skills": SkillSet(domains={"marketing": 8}),
+            }
+        )
+        observer = SocialIntelligence(agent=observer_agent, mind=sample_mind)
+        
+        stimulus = Stimulus(content="How should we test this?", topic="python testing")
+        context = SocialContext(
+            participants=[ParticipantInfo(agent_id="other-1", name="Bob")],
+            group_size=3,
+        )
+        
+        decisions = SocialIntelligence.evaluate_batch(
+            stimulus, context, [social_intelligence, observer]
+        )
+        
+        assert len(decisions) == 2
+        for intelligence, decision in zip([social_intelligence, observer], decisions):
+            expected = intelligence.should_i_speak(stimulus, context)
+            assert decision.intent == expected.intent
+            assert decision.reason == expected.reason
+            assert decision.factors == expected.factors
+    
     def test_get_speaking_confidence_for_topic(self, social_intelligence):
         """Test getting speaking confidence for a topic."""
         python_confidence = social_intelligence.get_speaking_confidence_for_topic("python development")
@@ -168,6 +168,33 @@ class TestExternalizationDecision:
         assert d["should_speak"] is True
         assert d["is_mandatory"] is False
         assert d["factors"]["expertise_relevance"] == 0.8
+    
+    def test_default_factors_shared_and_read_only(self):
+        """Test that decisions without factors share a read-only mapping."""
+        first = ExternalizationDecision.passive_awareness()
+        second = ExternalizationDecision.active_listen(confidence=0.5, reason="learning")
+        
+        assert first.factors is second.factors
+        with pytest.raises(TypeError):
+            first.factors["key"] = "value"
+        assert first.to_dict()["factors"] == {}
+        assert type(first.to_dict()["factors"]) is dict
+    
+    def test_decisions_compare_by_identity(self):
+        """Test that decisions are not compared field by field."""
+        first = ExternalizationDecision.passive_awareness()
+        second = ExternalizationDecision.passive_awareness()
+        
+        assert first == first
+        assert first != second
+        assert len({first, second}) == 2
+    
+    @pytest.mark.parametrize("intent", list(ExternalizationIntent))
+    def test_to_dict_intent_is_enum_value(self, intent):
+        """Test that every intent serializes to its enum value string."""
+        decision = ExternalizationDecision(intent=intent, confidence=0.5, reason="test")
+        
+        assert decision.to_dict()["intent"] == intent.value
 
 
 class TestDecisionFactories:
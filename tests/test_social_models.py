@@ -0,0 +1,234 @@
+"""Tests for social stimulus models.
+
+Tests for the Stimulus model from Phase 5.
+"""
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import pytest
+
+from src.social.models import Stimulus
+
+
+class TestExtractKeywords:
+    """Tests for keyword extraction."""
+
+    def test_filters_stop_words_and_short_words(self):
+        """Test that stop words and words of two letters or fewer are dropped."""
+        stimulus = Stimulus(content="What is the best way to scale an API?")
+
+        assert stimulus.extract_keywords() == ["what", "best", "way", "scale", "api"]
+
+    def test_trims_edge_punctuation(self):
+        """Test that punctuation is trimmed from word edges only."""
+        stimulus = Stimulus(content="(Caching) works with node.js, right?")
+
+        assert stimulus.extract_keywords() == ["caching", "works", "node.js", "right"]
+
+    def test_stop_words_with_punctuation_filtered(self):
+        """Test that stop words are recognized after trimming punctuation."""
+        stimulus = Stimulus(content="Because, the database... (it) failed")
+
+        assert stimulus.extract_keywords() == ["database", "failed"]
+
+    def test_batch_matches_per_stimulus_extraction(self):
+        """Test that batch extraction agrees with extract_keywords."""
+        stimuli = [
+            Stimulus(content="What is the best way to scale an API?"),
+            Stimulus(content=""),
+            Stimulus(content="(Caching) works with node.js, right?"),
+        ]
+
+        batch = Stimulus.extract_keywords_batch(stimuli)
+
+        assert batch == [stimulus.extract_keywords() for stimulus in stimuli]
+
+    def test_from_message_uses_keywords_as_topic(self):
+        """Test that from_message derives a topic from the first keywords."""
+        stimulus = Stimulus.from_message(content="How should we shard the Postgres cluster?")
+
+        assert stimulus.topic == "shard postgres cluster"
+
+
+class TestConstruction:
+    """Tests for the generated constructor and dataclass fields."""
+
+    def test_positional_fields_in_order(self):
+        """Test that positional arguments after timestamp reach priority."""
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        stimulus = Stimulus("Hello", None, None, None, "", moment, 0.9, True)
+
+        assert stimulus.timestamp == moment
+        assert stimulus.priority == 0.9
+        assert stimulus.requires_response is True
+
+    def test_asdict_includes_timestamp(self):
+        """Test that asdict reports the timestamp as a datetime field."""
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        stimulus = Stimulus(content="Hello", timestamp=moment)
+
+        assert asdict(stimulus)["timestamp"] == moment
+
+
+class TestFromBatch:
+    """Tests for batch construction."""
+
+    def test_from_batch_matches_constructor(self):
+        """Test that records map onto the leading fields in order."""
+        stimuli = Stimulus.from_batch([
+            ("Hello",),
+            ("Thoughts?", "agent-1", "Alice", ["agent-2"], "review"),
+        ])
+
+        assert stimuli[0].content == "Hello"
+        assert stimuli[0].is_broadcast is True
+        assert stimuli[1].source_name == "Alice"
+        assert stimuli[1].is_directed_at("agent-2") is True
+        assert stimuli[1].topic == "review"
+
+    def test_from_batch_shares_timestamp(self):
+        """Test that a batch is stamped with a single clock reading."""
+        stimuli = Stimulus.from_batch([("one",), ("two",), ("three",)])
+
+        assert len({stimulus.timestamp_ns for stimulus in stimuli}) == 1
+
+    def test_from_batch_full_length_records(self):
+        """Test that records may carry every constructor field."""
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        stimuli = Stimulus.from_batch([
+            ("Urgent?", "agent-1", "Alice", ["agent-2"], "ops", moment, 0.9, True),
+            ("Later", "agent-1", "Alice", None, "ops", None, 0.2),
+        ])
+
+        assert stimuli[0].timestamp == moment
+        assert stimuli[0].priority == 0.9
+        assert stimuli[0].requires_response is True
+        assert stimuli[1].timestamp != moment
+        assert stimuli[1].priority == 0.2
+
+    def test_from_batch_rejects_overlong_record(self):
+        """Test that a record with too many values is rejected."""
+        with pytest.raises(TypeError):
+            Stimulus.from_batch([("Hi", None, None, None, "", None, 0.5, False, "extra")])
+
+    def test_from_batch_empty(self):
+        """Test that an empty batch gives an empty list."""
+        assert Stimulus.from_batch([]) == []
+
+
+class TestMentionsAgent:
+    """Tests for detecting agent mentions in content."""
+
+    def test_name_mention_case_insensitive(self):
+        """Test that a name mention is found regardless of case."""
+        stimulus = Stimulus(content="alice, what do you think?")
+
+        assert stimulus.mentions_agent("agent-1", "Alice") is True
+
+    def test_at_mention(self):
+        """Test that @mentions are detected."""
+        stimulus = Stimulus(content="Ping @Alice about the release")
+
+        assert stimulus.mentions_agent("agent-1", "Alice") is True
+
+    def test_partial_word_is_not_a_mention(self):
+        """Test that a name inside a longer word does not count."""
+        stimulus = Stimulus(content="Ally and Alan will review it")
+
+        assert stimulus.mentions_agent("agent-1", "Al") is False
+
+    def test_name_with_punctuation(self):
+        """Test names containing regex metacharacters."""
+        stimulus = Stimulus(content="Thoughts, Dr. Smith?")
+
+        assert stimulus.mentions_agent("agent-1", "Dr. Smith") is True
+
+
+class TestToDict:
+    """Tests for Stimulus serialization."""
+
+    def test_to_dict_fields(self):
+        """Test the dictionary representation."""
+        stimulus = Stimulus(content="Hello", directed_at=["agent-1"], topic="greeting")
+
+        d = stimulus.to_dict()
+
+        assert d["content"] == "Hello"
+        assert d["topic"] == "greeting"
+        assert d["timestamp"] == stimulus.timestamp.isoformat()
+        assert d["is_directed"] is True
+        assert d["is_broadcast"] is False
+
+    def test_to_dict_tracks_timestamp_changes(self):
+        """Test that a replaced timestamp is reflected in later dicts."""
+        stimulus = Stimulus(content="Hello")
+        first = stimulus.to_dict()
+
+        stimulus.timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert stimulus.to_dict()["timestamp"] == "2024-01-01T00:00:00+00:00"
+        assert first["timestamp"] != "2024-01-01T00:00:00+00:00"
+
+    def test_timestamp_nanoseconds_follow_timestamp(self):
+        """Test that timestamp_ns is derived from the timestamp."""
+        moment = datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+        stimulus = Stimulus(content="Hello", timestamp=moment)
+
+        assert stimulus.timestamp_ns == 1_704_067_200_123_456_000
+        assert stimulus.to_dict()["timestamp"] == "2024-01-01T00:00:00.123456+00:00"
+
+    def test_timestamp_keyword_in_constructor(self):
+        """Test that a datetime passed as timestamp= sets timestamp_ns."""
+        moment = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        stimulus = Stimulus(content="Hello", timestamp=moment)
+
+        assert stimulus.timestamp == moment
+        assert stimulus.timestamp_ns == 1_704_067_200_000_000_000
+        assert stimulus.to_dict()["timestamp"] == "2024-01-01T00:00:00+00:00"
+
+    def test_assigned_timestamp_updates_nanoseconds(self):
+        """Test that assigning a datetime keeps timestamp_ns in step."""
+        earlier = Stimulus(content="First")
+        later = Stimulus(content="Second")
+
+        earlier.timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert earlier.timestamp_ns == 1_704_067_200_000_000_000
+        assert earlier.timestamp_ns < later.timestamp_ns
+
+    def test_to_dict_returns_independent_dicts(self):
+        """Test that mutating a returned dict does not affect later calls."""
+        stimulus = Stimulus(content="Hello")
+
+        stimulus.to_dict()["content"] = "changed"
+
+        assert stimulus.to_dict()["content"] == "Hello"
+
+
+class TestIsDirectedAt:
+    """Tests for checking who a stimulus is directed at."""
+
+    def test_broadcast_not_directed(self):
+        """Test that broadcasts are not directed at anyone."""
+        stimulus = Stimulus(content="Anyone?")
+
+        assert stimulus.is_directed_at("agent-1", "Alice") is False
+
+    def test_directed_by_id_or_name(self):
+        """Test matching by agent ID or case-insensitive name."""
+        stimulus = Stimulus(content="Thoughts?", directed_at=["agent-1", "BOB"])
+
+        assert stimulus.is_directed_at("agent-1") is True
+        assert stimulus.is_directed_at("agent-2", "bob") is True
+        assert stimulus.is_directed_at("agent-3", "Carol") is False
+
+    def test_reassigned_targets_are_used(self):
+        """Test that reassigning directed_at updates later lookups."""
+        stimulus = Stimulus(content="Thoughts?", directed_at=["agent-1"])
+        assert stimulus.is_directed_at("agent-1") is True
+
+        stimulus.directed_at = ["agent-2"]
+
+        assert stimulus.is_directed_at("agent-1") is False
+        assert stimulus.is_directed_at("agent-2") is True